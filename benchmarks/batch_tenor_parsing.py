@@ -0,0 +1,49 @@
+"""
+Compares parsing a column of tenors of a curve file with `parse_tenors` against
+calling `string_to_timedelta` for every cell, with and without its cache.
+
+    python -m benchmarks.batch_tenor_parsing
+"""
+
+from random import Random
+
+import numpy
+
+from benchmarks.suite import time_call
+from origin_common.utils import (
+    TENOR_CACHE_SIZE,
+    parse_tenors,
+    set_tenor_cache_size,
+    string_to_timedelta,
+)
+
+CELLS = 100000
+TENOR_STRINGS = ["O/N", "1W", "2W", "1M", "2M", "3M", "6M", "9M", "18M"] + [
+    f"{years}Y" for years in range(1, 31)
+]
+
+
+def make_column():
+    random = Random(0)
+    return numpy.array([random.choice(TENOR_STRINGS) for _ in range(CELLS)])
+
+
+def parse_cells(column):
+    return numpy.array([string_to_timedelta(cell) for cell in column], dtype="m8[us]")
+
+
+def main():
+    column = make_column()
+    assert (parse_cells(column) == parse_tenors(column)).all()
+    set_tenor_cache_size(0)
+    cases = [("per cell, no cache", time_call(lambda: parse_cells(column)))]
+    set_tenor_cache_size(TENOR_CACHE_SIZE)
+    cases.append(("per cell, cache", time_call(lambda: parse_cells(column))))
+    cases.append(("parse_tenors", time_call(lambda: parse_tenors(column))))
+    print(f"{'case':<22}{'time (ms)':>10}")
+    for name, seconds in cases:
+        print(f"{name:<22}{seconds * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
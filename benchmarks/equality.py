@@ -0,0 +1,60 @@
+"""
+Compares dict & set membership of constants and raw values against the
+previous hash based equality of constants.
+
+    python -m benchmarks.equality
+"""
+
+from benchmarks.suite import time_call
+from origin_common.constants import CURRENCIES, TENORS
+from origin_common.constants.base import Constant
+
+
+class LegacyConstant(Constant):
+    __slots__ = ()
+
+    def __eq__(self, other):
+        try:
+            return hash(self) == hash(other)
+        except TypeError:
+            return False
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+def legacy_copies(constants):
+    return [LegacyConstant(c.value, c.label) for c in constants]
+
+
+def main():
+    cases = []
+    for name, constants in (("tenors", list(TENORS)), ("currencies", list(CURRENCIES))):
+        for label, items in (
+            ("current", constants),
+            ("legacy", legacy_copies(constants)),
+        ):
+            namespace = {
+                "constant": items[len(items) // 2],
+                "value": items[len(items) // 2].value,
+                "constant_set": set(items),
+                "value_mapping": {c.value: c for c in items},
+            }
+            cases.append((name, label, namespace))
+
+    statements = (
+        ("constant in set", "constant in constant_set"),
+        ("value in set", "value in constant_set"),
+        ("constant in mapping", "value_mapping[constant]"),
+    )
+    print(f"{'registry':<12}{'lookup':<22}{'legacy (ns)':>12}{'current (ns)':>13}")
+    for name in ("tenors", "currencies"):
+        namespaces = {label: ns for n, label, ns in cases if n == name}
+        for description, statement in statements:
+            legacy = time_call(statement, namespace=namespaces["legacy"]) * 1e9
+            current = time_call(statement, namespace=namespaces["current"]) * 1e9
+            print(f"{name:<12}{description:<22}{legacy:>12.1f}{current:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
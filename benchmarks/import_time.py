@@ -0,0 +1,58 @@
+"""
+Measures the time spent importing the modules of origin_common with
+`python -X importtime`, when importing a single registry and all of them.
+The modules are imported with their bytecode cached, as in production, even if
+PYTHONDONTWRITEBYTECODE is set.
+
+    python -m benchmarks.import_time
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+IMPORT_TIME_REGEX = re.compile(
+    # import time: self [us] | cumulative | imported package
+    r"^import time:\s*(?P<self>\d+) \|\s*\d+ \|\s*(?P<package>\S+)"
+)
+REPEAT = 5
+CASES = (
+    ("TENORS only", "from origin_common.constants import TENORS"),
+    (
+        "all registries",
+        "from origin_common.constants import ADJUSTMENTS, BUSINESS_DAY_CONVENTIONS, "
+        "CALENDARS, CURRENCIES, DAY_COUNTS, FUNDING_BASES, PAYMENT_FREQUENCIES, TENORS",
+    ),
+)
+
+
+def import_time(statement: str) -> float:
+    """Returns the time spent in origin_common modules, in milliseconds."""
+    environment = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=environment,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_REGEX.match(line)
+        if match and match.group("package").startswith("origin_common"):
+            total += int(match.group("self"))
+    return total / 1000
+
+
+def main():
+    for description, statement in CASES:
+        # writes the bytecode of the modules that changed
+        import_time(statement)
+        best = min(import_time(statement) for _ in range(REPEAT))
+        print(f"{description:<16}{best:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Compares the lookups of constants before instrumentation is enabled, while it
+is enabled and after it is disabled again.
+
+    python -m benchmarks.instrumentation
+"""
+
+from benchmarks.suite import time_call
+from origin_common.constants import CURRENCIES
+
+
+def measure():
+    return [
+        ("__getitem__", time_call(lambda: CURRENCIES["EUR"])),
+        ("get miss", time_call(lambda: CURRENCIES.get("XXX"))),
+        ("get_by_label", time_call(lambda: CURRENCIES.get_by_label("EUR"))),
+        ("__contains__", time_call(lambda: "EUR" in CURRENCIES)),
+    ]
+
+
+def main():
+    before = measure()
+    CURRENCIES.enable_instrumentation()
+    enabled = measure()
+    CURRENCIES.disable_instrumentation()
+    disabled = measure()
+    print(f"{'case':<16}{'before (ns)':>12}{'enabled (ns)':>14}{'disabled (ns)':>15}")
+    for (name, a), (_, b), (_, c) in zip(before, enabled, disabled):
+        print(f"{name:<16}{a * 1e9:>12.0f}{b * 1e9:>14.0f}{c * 1e9:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Compares encoding a payload of trades holding constants with the patched
+default `JSONEncoder` against `ConstantsJSONEncoder`, both in one go and
+streamed to a file, and with orjson when it is installed.
+
+    python -m benchmarks.json_encoding
+"""
+
+import io
+import json
+
+from benchmarks.suite import time_call
+from origin_common.constants import CURRENCIES, FUNDING_BASES, TENORS
+from origin_common.constants.encoders import ConstantsJSONEncoder, json_default
+
+ROWS = 50000
+
+
+def make_trades():
+    currencies, tenors, bases = list(CURRENCIES), list(TENORS), list(FUNDING_BASES)
+    return [
+        {
+            "id": i,
+            "currency": currencies[i % len(currencies)],
+            "tenor": tenors[i % len(tenors)],
+            "funding_basis": bases[i % len(bases)],
+            "spread": i / 100,
+            "issuer": "ACME",
+        }
+        for i in range(ROWS)
+    ]
+
+
+def main():
+    trades = make_trades()
+    cases = [
+        ("dumps", lambda: json.dumps(trades)),
+        ("dumps encoder", lambda: json.dumps(trades, cls=ConstantsJSONEncoder)),
+        ("dump stream", lambda: json.dump(trades, io.StringIO())),
+        (
+            "dump stream encoder",
+            lambda: json.dump(trades, io.StringIO(), cls=ConstantsJSONEncoder),
+        ),
+    ]
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        cases.append(("orjson", lambda: orjson.dumps(trades, default=json_default)))
+    print(f"{'case':<24}{'time (ms)':>10}")
+    for name, func in cases:
+        print(f"{name:<24}{time_call(func) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
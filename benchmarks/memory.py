@@ -0,0 +1,57 @@
+"""
+Compares the memory used by the slotted constants against the same
+attributes stored in a `__dict__`, which is how constants used to be laid out.
+
+    python -m benchmarks.memory
+"""
+
+import tracemalloc
+
+from origin_common.constants import CURRENCIES, FUNDING_BASES, TENORS
+from origin_common.constants.base import get_public_slots
+
+COPIES = 10000
+
+
+class DictLayout:
+    def __init__(self, constant):
+        self.__dict__.update(
+            (key, getattr(constant, key)) for key in get_public_slots(type(constant))
+        )
+        self._mutable = False
+        self._creation_counter = constant.ordinal
+
+
+def copy_slotted(constant):
+    cls = type(constant)
+    copy = cls.__new__(cls)
+    for key in get_public_slots(cls) + ("_ordinal", "_hash"):
+        object.__setattr__(copy, key, getattr(constant, key))
+    object.__setattr__(copy, "_mutable", False)
+    return copy
+
+
+def measure(factory, constant):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    copies = [factory(constant) for _ in range(COPIES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # the list holding the copies is not part of the constants
+    size -= copies.__sizeof__()
+    return size / COPIES
+
+
+def main():
+    print(f"{'constant':<24}{'dict (B)':>10}{'slots (B)':>11}{'saving':>8}")
+    for constant in (TENORS.THREE_MONTH, CURRENCIES.EUR, FUNDING_BASES.EUR_3M):
+        with_dict = measure(DictLayout, constant)
+        with_slots = measure(copy_slotted, constant)
+        name = type(constant).__name__
+        saving = 1 - with_slots / with_dict
+        print(f"{name:<24}{with_dict:>10.0f}{with_slots:>11.0f}{saving:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
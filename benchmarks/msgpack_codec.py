@@ -0,0 +1,84 @@
+"""
+Compares the size and speed of quotes packed with msgpack when the constants
+are sent as strings (looked up again when unpacked) against `MsgpackCodec`.
+
+    python -m benchmarks.msgpack_codec
+"""
+
+import msgpack
+
+from benchmarks.suite import time_call
+from origin_common.constants import CURRENCIES, FUNDING_BASES, TENORS
+from origin_common.constants.encoders import MsgpackCodec
+
+QUOTES = 100000
+
+
+def make_quotes():
+    currencies, tenors, bases = list(CURRENCIES), list(TENORS), list(FUNDING_BASES)
+    return [
+        {
+            "currency": currencies[i % len(currencies)],
+            "tenor": tenors[i % len(tenors)],
+            "funding_basis": bases[i % len(bases)],
+            "spread": i / 100,
+        }
+        for i in range(QUOTES)
+    ]
+
+
+def pack_strings(quotes):
+    return [
+        msgpack.packb(
+            {
+                "currency": quote["currency"].value,
+                "tenor": quote["tenor"].label,
+                "funding_basis": quote["funding_basis"].value,
+                "spread": quote["spread"],
+            }
+        )
+        for quote in quotes
+    ]
+
+
+def unpack_strings(messages):
+    quotes = []
+    for message in messages:
+        quote = msgpack.unpackb(message)
+        quote["currency"] = CURRENCIES.get(quote["currency"])
+        quote["tenor"] = TENORS.get_by_label(quote["tenor"])
+        quote["funding_basis"] = FUNDING_BASES.get(quote["funding_basis"])
+        quotes.append(quote)
+    return quotes
+
+
+def main():
+    quotes = make_quotes()
+    codec = MsgpackCodec()
+    string_messages = pack_strings(quotes)
+    codec_messages = [codec.packb(quote) for quote in quotes]
+    assert [codec.unpackb(message) for message in codec_messages] == quotes
+    print(f"{'case':<10}{'bytes':>8}{'pack (ms)':>11}{'unpack (ms)':>13}")
+    for name, messages, pack, unpack in (
+        (
+            "strings",
+            string_messages,
+            lambda: pack_strings(quotes),
+            lambda: unpack_strings(string_messages),
+        ),
+        (
+            "codec",
+            codec_messages,
+            lambda: [codec.packb(quote) for quote in quotes],
+            lambda: [codec.unpackb(message) for message in codec_messages],
+        ),
+    ):
+        size = sum(map(len, messages)) / len(messages)
+        print(
+            f"{name:<10}{size:>8.1f}{time_call(pack) * 1000:>11.1f}"
+            f"{time_call(unpack) * 1000:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares the checks on tenors made with their exact periods against the same
+checks made with timedelta float math, which they replaced: `is_callable_tenor`
+and picking the units of `timedelta_to_string`.
+
+    python -m benchmarks.periods
+"""
+
+from datetime import timedelta
+
+from benchmarks.suite import time_call
+from origin_common import utils
+from origin_common.constants import TENORS
+from origin_common.constants.tenors import (
+    ONE_MONTH_TIMEDELTA,
+    ONE_YEAR_TIMEDELTA,
+    THREE_MONTH_TIMEDELTA,
+)
+from origin_common.utils import DAYS_IN_A_MONTH, DAYS_IN_A_WEEK, DAYS_IN_A_YEAR
+
+get_duration_units = vars(utils)["__get_duration_units"]
+
+
+def legacy_is_callable_tenor(value):
+    return (
+        value >= ONE_YEAR_TIMEDELTA
+        or (value % THREE_MONTH_TIMEDELTA).days == 0
+        or value == ONE_MONTH_TIMEDELTA
+    )
+
+
+def legacy_get_duration_units(duration, only_quarter_years=True):
+    total_days = duration.total_seconds() / 86400.0
+    if total_days < DAYS_IN_A_MONTH:
+        return "W", total_days // DAYS_IN_A_WEEK
+    if total_days < DAYS_IN_A_YEAR or (
+        only_quarter_years and duration % timedelta(days=3 * DAYS_IN_A_MONTH)
+    ):
+        return "M", total_days / DAYS_IN_A_MONTH
+    return "Y", total_days / DAYS_IN_A_YEAR
+
+
+def main():
+    tenors = list(TENORS)
+    values = [tenor.value for tenor in tenors]
+    for tenor, value in zip(tenors, values):
+        assert tenor.is_callable_tenor == legacy_is_callable_tenor(value)
+        assert get_duration_units(value) == legacy_get_duration_units(value)
+
+    cases = (
+        (
+            "is_callable_tenor",
+            lambda: [legacy_is_callable_tenor(value) for value in values],
+            lambda: [tenor.is_callable_tenor for tenor in tenors],
+        ),
+        (
+            "duration units",
+            lambda: [legacy_get_duration_units(value) for value in values],
+            lambda: [get_duration_units(value) for value in values],
+        ),
+    )
+    print(f"{'case':<20}{'timedelta (ns)':>16}{'period (ns)':>14}")
+    for name, legacy, current in cases:
+        before, after = (time_call(f) / len(TENORS) * 1e9 for f in (legacy, current))
+        print(f"{name:<20}{before:>16.0f}{after:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares pickling a list of constants by reference against pickling copies of
+them, which is how constants used to be pickled.
+
+    python -m benchmarks.pickling
+"""
+
+import io
+import pickle
+from itertools import cycle, islice
+
+from benchmarks.suite import time_call
+from origin_common.constants import CURRENCIES, FUNDING_BASES, TENORS
+from origin_common.constants.base import Constant
+
+COUNT = 1000000
+
+
+class CopyingPickler(pickle.Pickler):
+    def reducer_override(self, obj):
+        if isinstance(obj, Constant):
+            # skips Constant.__reduce_ex__
+            return object.__reduce_ex__(obj, pickle.HIGHEST_PROTOCOL)
+        return NotImplemented
+
+
+def dumps_copies(obj):
+    stream = io.BytesIO()
+    CopyingPickler(stream, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return stream.getvalue()
+
+
+def dumps(obj):
+    return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def main():
+    constants = list(
+        islice(cycle(list(FUNDING_BASES) + list(CURRENCIES) + list(TENORS)), COUNT)
+    )
+    print(f"{'case':<12}{'bytes':>10}{'dumps (ms)':>12}{'loads (ms)':>12}{'same':>6}")
+    for name, func in (("copies", dumps_copies), ("reference", dumps)):
+        data = func(constants)
+        loaded = pickle.loads(data)
+        same = all(a is b for a, b in zip(loaded, constants))
+        dumps_time = time_call(lambda: func(constants), repeat=3)
+        loads_time = time_call(lambda: pickle.loads(data), repeat=3)
+        print(
+            f"{name:<12}{len(data):>10}{dumps_time * 1000:>12.1f}"
+            f"{loads_time * 1000:>12.1f}{str(same):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
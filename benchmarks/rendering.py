@@ -0,0 +1,40 @@
+"""
+Compares rendering constants with `str` & `repr` when they have to be
+rendered from scratch, which is what used to happen on every call, against the
+cached renderings and the short repr.
+
+    python -m benchmarks.rendering
+"""
+
+from benchmarks.suite import time_call
+from origin_common.constants import CURRENCIES, FUNDING_BASES, TENORS, base
+
+
+def uncached(func):
+    def render(constant):
+        # as if an attribute had been set, so that nothing is cached
+        base.RENDER_GENERATION += 1
+        return func(constant)
+
+    return render
+
+
+def main():
+    print(f"{'constant':<24}{'':<6}{'uncached (us)':>14}{'cached (us)':>12}")
+    for constant in (TENORS.THREE_MONTH, CURRENCIES.EUR, FUNDING_BASES.EUR_3M):
+        name = type(constant).__name__
+        for func in (str, repr):
+            render = uncached(func)
+            before = time_call(lambda: render(constant)) * 1e6
+            after = time_call(lambda: func(constant)) * 1e6
+            print(f"{name:<24}{func.__name__:<6}{before:>14.2f}{after:>12.2f}")
+        short = time_call(lambda: repr_short(constant)) * 1e6
+        print(f"{name:<24}{'short':<6}{'':>14}{short:>12.2f}")
+
+
+def repr_short(constant):
+    return constant.short_repr()
+
+
+if __name__ == "__main__":
+    main()
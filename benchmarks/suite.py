@@ -0,0 +1,309 @@
+"""
+Benchmarks of the hot paths of origin_common, to catch performance regressions.
+The results of a run can be saved as a baseline, later runs are compared to it
+and the benchmarks that got slower than the threshold are flagged.
+
+    python -m benchmarks.suite run [-k lookup] [--save master]
+    python -m benchmarks.suite compare master [--threshold 0.2]
+    python -m benchmarks.suite compare master my-branch
+
+Baselines are saved in benchmarks/baselines/, they are only comparable with runs
+on the same machine. The committed "master" baseline is what `tox -e benchmarks`
+compares to, save it again after an intended change of performance. Benchmarks
+of the Django & DRF fields are skipped when those aren't installed. `compare`
+exits with 1 when there are regressions. The other scripts of benchmarks/ time
+with `time_call` too.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from timeit import Timer
+from typing import Callable, Dict, Tuple, Union
+
+from benchmarks.import_time import import_time
+from origin_common.constants import CURRENCIES, FUNDING_BASES, TENORS
+from origin_common.constants.encoders import ConstantsJSONEncoder
+from origin_common.utils import string_to_timedelta, timedelta_to_string
+
+BASELINES_DIR = Path(__file__).parent / "baselines"
+REPEAT = 5
+DEFAULT_THRESHOLD = 0.2
+
+BENCHMARKS: Dict[str, Tuple[Callable, Callable]] = {}
+
+
+def time_call(
+    statement: Union[Callable, str],
+    number: int = None,
+    repeat: int = REPEAT,
+    namespace: dict = None,
+) -> float:
+    """
+    Returns the best time of a run of `statement`, a function or code run in
+    `namespace`, in seconds. It's run `number` times per repeat, by default as
+    many times as fit in 0.2 s.
+    """
+    timer = Timer(statement, globals=namespace)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def time_import(statement: str) -> float:
+    """Returns the best time spent in origin_common modules, in seconds."""
+    return min(import_time(statement) for _ in range(REPEAT)) / 1000
+
+
+def benchmark(name: str, measure: Callable = time_call) -> Callable:
+    """
+    Registers a benchmark. The decorated function sets it up and returns what
+    `measure` times, by default a function that is called repeatedly.
+    """
+
+    def decorator(setup: Callable) -> Callable:
+        BENCHMARKS[name] = (setup, measure)
+        return setup
+
+    return decorator
+
+
+def setup_django() -> None:
+    import django
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure()
+        django.setup()
+
+
+@benchmark("lookup.getitem")
+def lookup_getitem():
+    return lambda: CURRENCIES["EUR"]
+
+
+@benchmark("lookup.get_miss")
+def lookup_get_miss():
+    return lambda: CURRENCIES.get("XXX")
+
+
+@benchmark("lookup.get_by_label")
+def lookup_get_by_label():
+    return lambda: FUNDING_BASES.get_by_label("3mEURIBOR")
+
+
+@benchmark("lookup.contains")
+def lookup_contains():
+    return lambda: "EUR" in CURRENCIES
+
+
+@benchmark("lookup.normalized")
+def lookup_normalized():
+    return lambda: FUNDING_BASES.lookup("3m euribor")
+
+
+@benchmark("utils.string_to_timedelta")
+def utils_string_to_timedelta():
+    return lambda: string_to_timedelta("3M")
+
+
+@benchmark("utils.string_to_timedelta_range")
+def utils_string_to_timedelta_range():
+    return lambda: string_to_timedelta("1Y-2Y")
+
+
+@benchmark("utils.timedelta_to_string")
+def utils_timedelta_to_string():
+    duration = string_to_timedelta("18M")
+    return lambda: timedelta_to_string(duration)
+
+
+@benchmark("utils.timedelta_to_string_full")
+def utils_timedelta_to_string_full():
+    duration = timedelta(days=400)
+    return lambda: timedelta_to_string(duration, only_initial=False, round_ndigits=2)
+
+
+@benchmark("django.to_python")
+def django_to_python():
+    setup_django()
+    from origin_common.constants.django.model_fields import CurrencyField
+
+    field = CurrencyField()
+    return lambda: field.to_python("EUR")
+
+
+@benchmark("drf.choice_field")
+def drf_choice_field():
+    setup_django()
+    from origin_common.constants.django.serializer_fields import ChoiceField
+
+    return lambda: ChoiceField(FUNDING_BASES)
+
+
+@benchmark("drf.choice_field_validation")
+def drf_choice_field_validation():
+    setup_django()
+    from origin_common.constants.django.serializer_fields import ChoiceField
+
+    field = ChoiceField(FUNDING_BASES)
+    return lambda: field.run_validation("3M_EUR")
+
+
+@benchmark("json.registry")
+def json_registry():
+    return lambda: json.dumps(FUNDING_BASES)
+
+
+@benchmark("json.constants")
+def json_constants():
+    constants = (list(CURRENCIES) + list(TENORS)) * 20
+    return lambda: json.dumps(constants)
+
+
+@benchmark("json.constants_encoder")
+def json_constants_encoder():
+    constants = (list(CURRENCIES) + list(TENORS)) * 20
+    return lambda: json.dumps(constants, cls=ConstantsJSONEncoder)
+
+
+@benchmark("import.tenors", measure=time_import)
+def import_tenors():
+    return "from origin_common.constants import TENORS"
+
+
+@benchmark("import.all_registries", measure=time_import)
+def import_all_registries():
+    return (
+        "from origin_common.constants import ADJUSTMENTS, BUSINESS_DAY_CONVENTIONS, "
+        "CALENDARS, CURRENCIES, DAY_COUNTS, FUNDING_BASES, PAYMENT_FREQUENCIES, TENORS"
+    )
+
+
+def run(names) -> Dict[str, float]:
+    results = {}
+    for name in names:
+        setup, measure = BENCHMARKS[name]
+        try:
+            target = setup()
+        except ImportError as e:
+            print(f"{name:<36}skipped ({e})")
+            continue
+        results[name] = measure(target)
+        print(f"{name:<36}{format_time(results[name]):>12}")
+    return results
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("ns", 1e9), ("us", 1e6), ("ms", 1e3)):
+        if seconds * scale < 1000:
+            return f"{seconds * scale:.1f} {unit}"
+    return f"{seconds:.2f} s"
+
+
+def baseline_path(name: str) -> Path:
+    return BASELINES_DIR / f"{name}.json"
+
+
+def save(name: str, results: Dict[str, float]) -> None:
+    BASELINES_DIR.mkdir(exist_ok=True)
+    baseline = {
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "results": results,
+    }
+    with baseline_path(name).open("w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+    print(f"Saved as {baseline_path(name)}")
+
+
+def load(name: str) -> dict:
+    with baseline_path(name).open() as f:
+        return json.load(f)
+
+
+def compare(
+    baseline: Dict[str, float], current: Dict[str, float], threshold: float
+) -> bool:
+    """
+    Prints the change of each benchmark that is in both results, a benchmark
+    is flagged when it is `threshold` (0.2 is 20%) slower or faster.
+    Returns whether any benchmark got slower.
+    """
+    regressed = False
+    print(f"{'benchmark':<36}{'baseline':>12}{'current':>12}{'change':>9}")
+    for name in sorted(baseline.keys() & current.keys()):
+        ratio = current[name] / baseline[name]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  slower"
+            regressed = True
+        elif ratio < 1 / (1 + threshold):
+            flag = "  faster"
+        print(
+            f"{name:<36}{format_time(baseline[name]):>12}"
+            f"{format_time(current[name]):>12}{ratio - 1:>+9.0%}{flag}"
+        )
+    return regressed
+
+
+def select(pattern: str = None):
+    return [name for name in BENCHMARKS if not pattern or pattern in name]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-k", help="only run the benchmarks containing this")
+    run_parser.add_argument("--save", metavar="NAME", help="save as a baseline")
+    compare_parser = commands.add_parser(
+        "compare", help="compare a baseline with another one or with a new run"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current", nargs="?")
+    compare_parser.add_argument(
+        "-k", help="only compare the benchmarks containing this"
+    )
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="default: 0.2"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(select(args.k))
+        if args.save:
+            save(args.save, results)
+        return 0
+
+    baseline = load(args.baseline)
+    baseline["results"] = {
+        name: seconds
+        for name, seconds in baseline["results"].items()
+        if not args.k or args.k in name
+    }
+    if args.current:
+        current = load(args.current)
+    else:
+        current = {
+            "machine": platform.node(),
+            "results": run(
+                [name for name in BENCHMARKS if name in baseline["results"]]
+            ),
+        }
+        print()
+    if baseline["machine"] != current["machine"]:
+        print(
+            f"Warning: the baseline is from {baseline['machine']}, "
+            f"timings of different machines aren't comparable."
+        )
+    return int(compare(baseline["results"], current["results"], args.threshold))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Compares formatting the maturities of a report with `format_tenors` against
+calling `timedelta_to_string` for every maturity, with a few of its flags.
+
+    python -m benchmarks.tenor_formatting
+"""
+
+from datetime import timedelta
+from random import Random
+
+import numpy
+
+from benchmarks.suite import time_call
+from origin_common.utils import format_tenors, timedelta_to_string
+
+COUNT = 300000
+FLAGS = (
+    ("default", {}),
+    ("round_ndigits=1", {"round_ndigits": 1}),
+    ("only_initial=False", {"only_initial": False, "round_ndigits": 2}),
+    ("for_quantlib", {"for_quantlib": True}),
+)
+
+
+def make_maturities():
+    random = Random(0)
+    # days to maturity of bonds up to 30 years
+    return numpy.array(
+        [timedelta(days=random.randint(1, 30 * 365)) for _ in range(COUNT)],
+        dtype="m8[us]",
+    )
+
+
+def main():
+    maturities = make_maturities()
+    timedeltas = maturities.tolist()
+    print(f"{'flags':<22}{'per value (ms)':>16}{'format_tenors (ms)':>20}")
+    for name, flags in FLAGS:
+        expected = [timedelta_to_string(td, **flags) for td in timedeltas]
+        assert format_tenors(maturities, **flags).tolist() == expected
+        per_value = time_call(
+            lambda: [timedelta_to_string(td, **flags) for td in timedeltas], repeat=3
+        )
+        vectorized = time_call(lambda: format_tenors(maturities, **flags), repeat=3)
+        print(f"{name:<22}{per_value * 1000:>16.1f}{vectorized * 1000:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compares the operator methods made by `add_operator_methods` for tenors
+against the `perform_on_constant` wrappers tenors used to have.
+
+    python -m benchmarks.tenor_operators
+"""
+
+from datetime import timedelta
+
+from benchmarks.suite import time_call
+from origin_common.constants import TENORS
+from origin_common.constants.base import OPERATOR_METHODS, perform_on_constant
+from origin_common.constants.tenors import Tenor
+
+
+class LegacyTenor(Tenor):
+    __slots__ = ()
+
+
+for _name in OPERATOR_METHODS:
+    if hasattr(timedelta, _name):
+        setattr(LegacyTenor, _name, perform_on_constant(getattr(timedelta, _name)))
+
+STATEMENTS = (
+    "tenor + other_tenor",
+    "tenor + delta",
+    "delta + tenor",
+    "tenor * 2",
+    "tenor < other_tenor",
+)
+
+
+def namespace(tenor_cls):
+    return {
+        "tenor": tenor_cls(TENORS.THREE_MONTH.value, "3M", ""),
+        "other_tenor": tenor_cls(TENORS.SIX_MONTH.value, "6M", ""),
+        "delta": timedelta(days=1),
+    }
+
+
+def main():
+    legacy, current = namespace(LegacyTenor), namespace(Tenor)
+    print(f"{'operation':<22}{'legacy (ns)':>12}{'current (ns)':>14}{'speedup':>9}")
+    for statement in STATEMENTS:
+        before = time_call(statement, namespace=legacy) * 1e9
+        after = time_call(statement, namespace=current) * 1e9
+        print(f"{statement:<22}{before:>12.0f}{after:>14.0f}{before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
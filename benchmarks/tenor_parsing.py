@@ -0,0 +1,69 @@
+"""
+Measures the throughput of `string_to_timedelta` on the tenors of a stream of
+quotes, a few dozen distinct strings repeated many times, with and without
+its cache.
+
+    python -m benchmarks.tenor_parsing
+"""
+
+from random import Random
+
+from benchmarks.suite import time_call
+from origin_common.utils import (
+    TENOR_CACHE_SIZE,
+    set_tenor_cache_size,
+    string_to_timedelta,
+    tenor_cache_info,
+)
+
+COUNT = 200000
+TENOR_STRINGS = [
+    "O/N",
+    "1W",
+    "2W",
+    "1M",
+    "2M",
+    "3M",
+    "6M",
+    "9M",
+    "1Y",
+    "18M",
+    "2Y",
+    "3Y",
+    "5Y",
+    "7Y",
+    "10Y",
+    "30Y",
+    "3m",
+    "1y ",
+    "NC5Y",
+    "1-3Y",
+    "3-5Y",
+    "5-10Y",
+    "1Y-2Y",
+    "6M-1Y",
+]
+
+
+def make_quotes():
+    random = Random(0)
+    return [random.choice(TENOR_STRINGS) for _ in range(COUNT)]
+
+
+def parse_all(quotes):
+    for tenor in quotes:
+        string_to_timedelta(tenor)
+
+
+def main():
+    quotes = make_quotes()
+    print(f"{'case':<14}{'time (ms)':>10}{'tenors/s':>14}")
+    for name, maxsize in (("no cache", 0), ("cache", TENOR_CACHE_SIZE)):
+        set_tenor_cache_size(maxsize)
+        seconds = time_call(lambda: parse_all(quotes))
+        print(f"{name:<14}{seconds * 1000:>10.1f}{COUNT / seconds:>14,.0f}")
+    print(tenor_cache_info())
+
+
+if __name__ == "__main__":
+    main()
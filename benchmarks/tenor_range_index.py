@@ -0,0 +1,78 @@
+"""
+Matches the tenors of a stream of quotes against the tenor ranges of client
+appetite, with `TenorRangeIndex` and with a linear scan of the parsed ranges.
+The linear scan is timed on a sample of the quotes and scaled up.
+
+    python -m benchmarks.tenor_range_index
+"""
+
+from random import Random
+
+import numpy
+
+from benchmarks.suite import time_call
+from origin_common.constants import TENORS
+from origin_common.utils import TenorRangeIndex, string_to_timedelta
+
+RANGE_COUNT = 10000
+QUOTE_COUNT = 100000
+SAMPLE_COUNT = 500
+# in ascending order
+TENOR_LABELS = [tenor.label for tenor in TENORS if tenor.label != "O/N"]
+
+
+def make_ranges(random):
+    ranges = []
+    for _ in range(RANGE_COUNT):
+        first = random.randrange(len(TENOR_LABELS) - 1)
+        last = min(first + random.randint(1, 8), len(TENOR_LABELS) - 1)
+        prefix = random.choice(("", "nc"))
+        ranges.append(f"{prefix}{TENOR_LABELS[first]}-{TENOR_LABELS[last]}")
+    return ranges
+
+
+def make_quotes(random):
+    tenors = [random.choice(TENOR_LABELS) for _ in range(QUOTE_COUNT)]
+    # and remaining maturities, which are all distinct
+    days = numpy.array([random.uniform(7, 18000) for _ in range(QUOTE_COUNT)])
+    return tenors, (days * 86400e6).astype("m8[us]")
+
+
+def linear_scan(parsed, tenor):
+    return [
+        position
+        for position, (start, end) in enumerate(parsed)
+        if start <= tenor <= end
+    ]
+
+
+def main():
+    random = Random(0)
+    ranges = make_ranges(random)
+    tenors, maturities = make_quotes(random)
+
+    index = TenorRangeIndex(ranges)
+    build = time_call(lambda: TenorRangeIndex(ranges))
+    print(f"{'build index':<32}{build * 1000:>10.1f} ms")
+    for name, quotes in (("tenors", tenors), ("maturities", maturities)):
+        matches = index.containing_many(quotes)
+        seconds = time_call(lambda: index.containing_many(quotes))
+        parsed = [string_to_timedelta(value) for value in ranges]
+        sample = [
+            string_to_timedelta(quote) if isinstance(quote, str) else quote.item()
+            for quote in quotes[:SAMPLE_COUNT]
+        ]
+        expected = [linear_scan(parsed, quote) for quote in sample]
+        scan = time_call(lambda: [linear_scan(parsed, quote) for quote in sample])
+        for found, positions in zip(matches, expected):
+            assert found.tolist() == positions
+        matched = sum(len(found) for found in matches)
+        print(f"{name + ' (index)':<32}{seconds * 1000:>10.1f} ms, {matched:,} matches")
+        print(
+            f"{name + ' (linear scan, scaled)':<32}"
+            f"{scan * len(quotes) / SAMPLE_COUNT * 1000:>10.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
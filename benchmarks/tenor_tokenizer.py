@@ -0,0 +1,104 @@
+"""
+Compares parsing tenor strings of quotes with the single pass tokenizer of
+`string_to_timedelta` against the regex & recursive splitting it replaced.
+The cache of `string_to_timedelta` is bypassed.
+
+    python -m benchmarks.tenor_tokenizer
+"""
+
+from datetime import timedelta
+
+from benchmarks.suite import time_call
+from origin_common import utils
+from origin_common.utils import (
+    DAYS_IN_A_MONTH,
+    DAYS_IN_A_WEEK,
+    DAYS_IN_A_YEAR,
+    SECONDS_IN_A_DAY,
+    TIMEDELTA_STRING_REGEX,
+)
+
+QUOTE_TENORS = [
+    "O/N",
+    "Overnight",
+    "1W",
+    "2 weeks",
+    "1M",
+    "3M",
+    "6m",
+    "18 Months",
+    "1Y",
+    "2y",
+    "5Y*",
+    "10 years",
+    "NC5Y",
+    "nc 10y",
+    "0.5Y",
+    "1.25Y",
+    "1-3Y",
+    "3-5Y",
+    "5 - 10 years",
+    "6M-1Y",
+    "1M - 10 Y",
+    "O/N-1W",
+]
+parse_tenor = vars(utils)["__parse_tenor"]
+
+
+def get_number_of_day(units):
+    multiplier = DAYS_IN_A_YEAR
+    if units:
+        if units.lower().startswith("w"):
+            multiplier = DAYS_IN_A_WEEK
+        elif units.lower().startswith("m"):
+            multiplier = DAYS_IN_A_MONTH
+    return multiplier
+
+
+def legacy_parse_tenor(input_string):
+    split_input = input_string.split("-", maxsplit=1)
+    if len(split_input) == 2:
+        start, start_unit = legacy_parse_tenor(split_input[0])
+        end, end_unit = legacy_parse_tenor(split_input[1])
+
+        if start_unit is None:
+            total_days = (
+                start.total_seconds()
+                / SECONDS_IN_A_DAY
+                / DAYS_IN_A_YEAR
+                * get_number_of_day(end_unit)
+            )
+            start = timedelta(days=total_days)
+        if end < start:
+            raise ValueError(f'Invalid input "{input_string}"!')
+        return start, end
+
+    match = TIMEDELTA_STRING_REGEX.match(input_string)
+    if not match:
+        input_string = input_string.strip()
+        if input_string.lower() == "overnight" or input_string.upper() == "O/N":
+            return timedelta(days=1), "O/N"
+        raise ValueError(f'Invalid input "{input_string}"!')
+
+    period_start, units = match.groups()
+    multiplier = get_number_of_day(units)
+    return timedelta(days=float(period_start) * multiplier), units
+
+
+def main():
+    print(f"{'tenor':<16}{'regex (ns)':>12}{'tokenizer (ns)':>16}")
+    totals = [0, 0]
+    for tenor in QUOTE_TENORS:
+        assert parse_tenor(tenor) == legacy_parse_tenor(tenor), tenor
+        legacy, current = (
+            time_call(lambda: legacy_parse_tenor(tenor)),
+            time_call(lambda: parse_tenor(tenor)),
+        )
+        totals[0] += legacy
+        totals[1] += current
+        print(f"{tenor!r:<16}{legacy * 1e9:>12.0f}{current * 1e9:>16.0f}")
+    print(f"{'all':<16}{totals[0] * 1e9:>12.0f}{totals[1] * 1e9:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,48 @@
-from origin_common.constants.adjustments import ADJUSTMENTS
-from origin_common.constants.business_day_conventions import BUSINESS_DAY_CONVENTIONS
-from origin_common.constants.calendars import CALENDARS
-from origin_common.constants.currencies import CURRENCIES
-from origin_common.constants.day_counts import DAY_COUNTS
-from origin_common.constants.funding_bases import (
-    BASIS_TYPE_FIXED,
-    BASIS_TYPE_FLOATING,
-    BASIS_TYPE_GOVIE,
-    BASIS_TYPE_MS,
-    CD_FUNDING_BASES,
-    FUNDING_BASES,
-    MTN_FUNDING_BASES,
-)
-from origin_common.constants.payment_frequencies import PAYMENT_FREQUENCIES
-from origin_common.constants.tenors import TENORS
+"""
+The constants are imported when they are first accessed (PEP 562), so that
+only the modules of the constants that are used get imported.
+"""
+
+import sys
+
+_LAZY_ATTRIBUTES = {
+    "ADJUSTMENTS": "adjustments",
+    "BUSINESS_DAY_CONVENTIONS": "business_day_conventions",
+    "CALENDARS": "calendars",
+    "CURRENCIES": "currencies",
+    "DAY_COUNTS": "day_counts",
+    "BASIS_TYPE_FIXED": "funding_bases",
+    "BASIS_TYPE_FLOATING": "funding_bases",
+    "BASIS_TYPE_GOVIE": "funding_bases",
+    "BASIS_TYPE_MS": "funding_bases",
+    "CD_FUNDING_BASES": "funding_bases",
+    "FUNDING_BASES": "funding_bases",
+    "MTN_FUNDING_BASES": "funding_bases",
+    "PAYMENT_FREQUENCIES": "payment_frequencies",
+    "TENORS": "tenors",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    # not importlib.import_module as it isn't reported by `python -X importtime`
+    module = __import__(f"{__name__}.{module_name}", fromlist=[name])
+    value = getattr(module, name)
+    # cache it so that __getattr__ is only called once per attribute
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ isn't supported
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
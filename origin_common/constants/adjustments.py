@@ -2,6 +2,8 @@ from origin_common.constants.base import Constant, Constants, add_sorting_functi
 
 
 class Adjustment(Constant[str]):
+    __slots__ = ()
+
     def __init__(self, value: str):
         super().__init__(value, value)
 
@@ -1,7 +1,25 @@
-from collections import OrderedDict
-from functools import lru_cache
+import operator
+import re
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from functools import lru_cache, update_wrapper
+from itertools import count
 from json import JSONEncoder
-from typing import Any, Callable, Dict, Generator, Generic, Tuple, TypeVar, Union
+from threading import RLock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from origin_common.text import join_list
 
 T = TypeVar("T")
 
@@ -79,7 +97,7 @@ class DuplicateConstantError(Exception):
 
 
 class ImmutableMixin:
-    _mutable = True
+    __slots__ = ("_mutable",)
 
     def make_immutable(self):
         self._mutable = False
@@ -89,42 +107,184 @@ class ImmutableMixin:
 
     def __setattr__(self, key: any, value: any) -> None:
         # allow changing private & protected variables as they are set from within
-        if not (self._mutable or key.startswith("_")):
+        if not (key.startswith("_") or getattr(self, "_mutable", True)):
             raise AttributeError("Cannot change constant values.")
         super().__setattr__(key, value)
 
 
+@lru_cache(maxsize=None)
+def get_public_slots(cls: type) -> Tuple[str, ...]:
+    """
+    Returns the public attributes declared in `__slots__` by the given class
+    and its parents, parents first.
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if not name.startswith("_"))
+    return tuple(names)
+
+
+# incremented whenever an attribute of any constant is set, so that the cached
+# renderings of constants showing other constants are recomputed as well
+RENDER_GENERATION = 0
+# a new number whenever the constants of any `Constants` may have changed, so that
+# caches over several constants can check all of them at once. The numbers are
+# unique rather than increasing, a change can't bring back an earlier one.
+CONSTANTS_GENERATION = 0
+_constants_generations = count(1)
+
+
 class Constant(Generic[T], ImmutableMixin):
-    creation_counter = 0
+    """
+    Constants use `__slots__` so they don't carry a `__dict__`. Subclasses
+    should declare the extra attributes they set in their own `__slots__`.
+    """
+
+    __slots__ = (
+        "value",
+        "label",
+        "_ordinal",
+        "_hash",
+        "_reference",
+        "_registries",
+        "_str_cache",
+        "_repr_cache",
+    )
+    # `repr` only shows where the constant comes from, see `short_repr`
+    use_short_repr = False
 
     def __init__(self, value: T, label: str):
         super().__init__()
-        self._creation_counter = Constant.creation_counter
-        Constant.creation_counter += 1
+        # the private attributes are set directly, they skip the checks of
+        # `__setattr__` for every constant built at import time
+        set_attribute = object.__setattr__
+        set_attribute(self, "_mutable", True)
+        set_attribute(self, "_ordinal", None)
+        set_attribute(self, "_reference", None)
+        set_attribute(self, "_registries", ())
+        set_attribute(self, "_str_cache", None)
+        set_attribute(self, "_repr_cache", None)
         self.value = value
         self.label = label
 
+    def __setattr__(self, key: str, value: Any) -> None:
+        # ImmutableMixin.__setattr__ inlined, as this runs for every attribute
+        # of every constant built at import time
+        if key.startswith("_"):
+            object.__setattr__(self, key, value)
+            return
+        if not getattr(self, "_mutable", True):
+            raise AttributeError("Cannot change constant values.")
+        object.__setattr__(self, key, value)
+        global RENDER_GENERATION
+        RENDER_GENERATION += 1
+        if key == "value":
+            # cached as it is used for every lookup & comparison of the constant
+            try:
+                object.__setattr__(self, "_hash", hash(value))
+            except TypeError:
+                object.__setattr__(self, "_hash", None)
+        # the lookups & cached results of all the constants holding it are stale,
+        # while they are mutable too (not set yet while unpickled by value)
+        for constants in getattr(self, "_registries", ()):
+            constants._invalidate()
+
+    def _attach(self, constants: "Constants", name: str) -> None:
+        """
+        Records that the constant is held by the given constants, the first one
+        is the one it is pickled by reference to.
+        """
+        if self._reference is None:
+            object.__setattr__(self, "_reference", (constants, name))
+        if not any(registry is constants for registry in self._registries):
+            object.__setattr__(self, "_registries", self._registries + (constants,))
+
     def __str__(self) -> str:
-        return ", ".join(
-            f"{key}={value}"
-            for key, value in self.__dict__.items()
+        """
+        Lists the public attributes. Cached until an attribute of any constant
+        is set, attributes changed in place (like a list) aren't picked up.
+        """
+        generation = RENDER_GENERATION
+        cache = self._str_cache
+        if cache is not None and cache[0] == generation:
+            return cache[1]
+        text = self._render_str()
+        object.__setattr__(self, "_str_cache", (generation, text))
+        return text
+
+    def _render_str(self) -> str:
+        attributes = [
+            (key, getattr(self, key))
+            for key in get_public_slots(type(self))
+            if hasattr(self, key)
+        ]
+        # subclasses that don't declare `__slots__` still have a `__dict__`
+        attributes.extend(
+            (key, value)
+            for key, value in getattr(self, "__dict__", {}).items()
             if not key.startswith("_")
         )
+        return ", ".join(f"{key}={value}" for key, value in attributes)
 
     def __format__(self, format_spec):
         return f"{self.value:{format_spec}}"
 
     def __repr__(self):
-        return f"<{self.__class__.__name__}: {self} at {hex(id(self))}>"
+        if self.use_short_repr:
+            return self.short_repr()
+        generation = RENDER_GENERATION
+        cache = self._repr_cache
+        if cache is not None and cache[0] == generation:
+            return cache[1]
+        text = f"<{self.__class__.__name__}: {self} at {hex(id(self))}>"
+        object.__setattr__(self, "_repr_cache", (generation, text))
+        return text
+
+    def short_repr(self) -> str:
+        """
+        Names the constant by its attribute in its constants, or by its label,
+        e.g. `<Tenor: Tenors.THREE_MONTH>`. Used by `repr` if `use_short_repr`
+        is set on the class (or on `Constant` for all constants).
+        """
+        if self._reference is not None:
+            constants, name = self._reference
+            return f"<{self.__class__.__name__}: {type(constants).__name__}.{name}>"
+        return f"<{self.__class__.__name__}: {self.label}>"
 
     def __eq__(self, other):
-        try:
-            return hash(self) == hash(other)
-        except TypeError:
-            return False
+        if self is other:
+            return True
+        if isinstance(other, Constant):
+            other = other.value
+        return self.value == other
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        if self._hash is None:
+            raise TypeError(f"unhashable value: '{type(self.value).__name__}'")
+        return self._hash
+
+    def __reduce_ex__(self, protocol):
+        """
+        Constants of a `Constants` are pickled (and copied) by reference, as the
+        constants and the attribute name, so they are unpickled as the same
+        object. Other constants are pickled as usual.
+        """
+        if self._reference is not None:
+            constants, name = self._reference
+            if getattr(constants, name, None) is self:
+                return getattr, self._reference
+        return super().__reduce_ex__(protocol)
+
+    @property
+    def ordinal(self) -> Union[int, None]:
+        """
+        Position of the constant in the constants it was defined in.
+        Can be used as a sort key: `sorted(bases, key=attrgetter("ordinal"))`.
+        """
+        return self._ordinal
 
     def to_json(self):
         return self.value
@@ -132,39 +292,252 @@ class Constant(Generic[T], ImmutableMixin):
 
 C = TypeVar("C", bound=Constant)
 
+CacheInfo = namedtuple("CacheInfo", ["generation", "currsize"])
+
+
+class LookupStats(namedtuple("LookupStats", ["lookups", "misses"])):
+    __slots__ = ()
+
+    @property
+    def miss_rate(self) -> float:
+        return self.misses / self.lookups if self.lookups else 0.0
+
+
+class cached_method:
+    """
+    Caches the results of a `Constants` method per arguments.
+    Unlike `lru_cache` the results are kept on the instance and are only used
+    for the generation of the constants they were computed for, so they are
+    recomputed after the constants have changed (see `Constants.generation`).
+    The arguments have to be hashable.
+    """
+
+    def __init__(self, method: Callable):
+        self.method = method
+        update_wrapper(self, method)
+
+    def __get__(self, instance: "Constants", owner: type = None):
+        if instance is None:
+            return self
+        return BoundCachedMethod(self.method, instance)
+
+
+class BoundCachedMethod:
+    __slots__ = ("method", "instance")
+
+    def __init__(self, method: Callable, instance: "Constants"):
+        self.method = method
+        self.instance = instance
+
+    def __call__(self, *args, **kwargs):
+        cache = self.instance._get_cached_results()
+        key = (self.method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = self.method(self.instance, *args, **kwargs)
+            return result
+
+    def cache_info(self) -> CacheInfo:
+        cache = self.instance._get_cached_results()
+        return CacheInfo(
+            self.instance.generation,
+            sum(1 for key in cache if key[0] == self.method.__name__),
+        )
+
+    def cache_clear(self) -> None:
+        cache = self.instance._get_cached_results()
+        for key in [key for key in cache if key[0] == self.method.__name__]:
+            del cache[key]
+
+
+NOT_PROVIDED = object()
+
+ON_MISSING_RAISE = "raise"
+ON_MISSING_NONE = "none"
+ON_MISSING_SKIP = "skip"
+ON_MISSING_CHOICES = (ON_MISSING_RAISE, ON_MISSING_NONE, ON_MISSING_SKIP)
+
+
+def get_many(
+    mapping: Dict[Any, C], keys: Iterable[Any], on_missing: str
+) -> Tuple[List[Union[C, None]], List[Any]]:
+    if on_missing not in ON_MISSING_CHOICES:
+        raise ValueError(
+            f"'on_missing' must be one of {join_list(ON_MISSING_CHOICES)}, "
+            f"not '{on_missing}'."
+        )
+    results = []
+    misses = []
+    for key in keys:
+        constant = mapping.get(key)
+        if constant is None:
+            misses.append(key)
+            if on_missing == ON_MISSING_SKIP:
+                continue
+        results.append(constant)
+    if misses and on_missing == ON_MISSING_RAISE:
+        raise KeyError(misses)
+    return results, misses
+
+
+# whitespace, punctuation & underscores, except for decimal points like in "1.5Y"
+IGNORED_IN_LOOKUP_KEYS = re.compile(r"[^\w.]|_|(?<!\d)\.|\.(?!\d)")
+
+
+def normalize_lookup_key(key: Any) -> Any:
+    """
+    Case folds the given string and strips its whitespace & punctuation,
+    e.g. " 6mUSD LIBOR " and "6musd-libor" are both "6musdlibor".
+    Constants are replaced by their value, other objects are returned as is.
+    """
+    if isinstance(key, Constant):
+        key = key.value
+    if isinstance(key, str):
+        return IGNORED_IN_LOOKUP_KEYS.sub("", key).casefold()
+    return key
+
+
+def get_related_attribute(obj: Any, lookup: str) -> Any:
+    """
+    Follows a django style lookup like `currency__is_g10` on the given object.
+    Raises an AttributeError if any of the attributes is missing or None.
+    """
+    for attr_name in lookup.split("__"):
+        if obj is None:
+            raise AttributeError(f"Cannot get '{attr_name}' of None.")
+        obj = getattr(obj, attr_name)
+    return obj
+
+
+class ConstantsSnapshot:
+    """
+    The constants of a `Constants` and the tables derived from them. A new
+    snapshot replaces the previous one as a whole whenever the constants
+    change, the tables are built on first use from the snapshot's own constants
+    and are only assigned once complete.
+    """
+
+    __slots__ = (
+        "fields",
+        "generation",
+        "cached_results",
+        "value_to_object_mapping",
+        "label_to_object_mapping",
+        "ordinals",
+        "indexes",
+        "decode_table",
+        "lookup_index",
+    )
+
+    def __init__(self, fields: Dict[str, C], generation: int):
+        self.fields = fields
+        self.generation = generation
+        self.cached_results = {}
+        self.value_to_object_mapping = None
+        self.label_to_object_mapping = None
+        self.ordinals = None
+        self.indexes = {}
+        self.decode_table = None
+        self.lookup_index = None
+
+
+class ConstantsDraft:
+    """
+    Changes to a `Constants` made in `Constants.mutate`, they are only applied
+    once the block exits without an exception.
+    """
+
+    def __init__(self, fields: Dict[str, C]):
+        object.__setattr__(self, "_fields", OrderedDict(fields))
+
+    def __getattr__(self, key: str) -> C:
+        try:
+            return self._fields[key]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' has no constant '{key}'")
+
+    def __setattr__(self, key: str, value: C) -> None:
+        if key.startswith("_") or not isinstance(value, Constant):
+            raise AttributeError("Only constants can be set on a draft.")
+        self._fields[key] = value
+
+    def __iter__(self) -> Generator[C, None, None]:
+        yield from self._fields.values()
+
 
 class Constants(Generic[C], ImmutableMixin):
     __instance = None
+    _ordered_fields: Dict[str, C] = OrderedDict()
+    # attributes of the constants that `lookup` also finds them by
+    lookup_aliases: Tuple[str, ...] = ()
 
     def __init__(self):
         super().__init__()
-        self.__value_to_object_mapping = None
-        self.__label_to_object_mapping = None
-        self.__object_set = None
+        try:
+            lock = self.__mutation_lock
+        except AttributeError:
+            fields = self._ordered_fields
+            self.__mutation_lock = RLock()
+            self.__set_snapshot(ConstantsSnapshot(fields, 1))
+        else:
+            # keeps the constants added to the instance if it is initialised
+            # again, the generation keeps going up for the caches keyed by it
+            with lock:
+                fields = self.__snapshot.fields
+                self.__set_snapshot(
+                    ConstantsSnapshot(fields, self.__snapshot.generation + 1)
+                )
+        for name, constant in fields.items():
+            constant._attach(self, name)
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collects the constants of the subclass in definition order once, when
+        the class is created, so that creating the singleton is cheap.
+        Constants inherited from parent classes come first, a redefinition
+        keeps the position of the original one.
+        """
+        super().__init_subclass__(**kwargs)
+        cls.__instance = None
+        fields = OrderedDict()
+        for base in reversed(cls.__mro__[1:]):
+            fields.update(base.__dict__.get("_ordered_fields", {}))
+        for attr_name, value in cls.__dict__.items():
+            if attr_name.startswith("_"):
+                continue
+            if isinstance(value, Constant):
+                fields[attr_name] = value
+            elif attr_name in fields:
+                # the inherited constant has been overridden by a non constant
+                del fields[attr_name]
+
+        seen = set()
+        for ordinal, constant in enumerate(fields.values()):
+            if constant.value in seen:
+                raise DuplicateConstantError(constant)
+            seen.add(constant.value)
+            if constant._ordinal is None:
+                constant._ordinal = ordinal
+        cls._ordered_fields = fields
 
     def __new__(cls, *args, **kwargs):
         if cls.__instance is None:
             cls.__instance = super().__new__(cls, *args, **kwargs)
-            fields = [
-                getattr(cls, attr_name)
-                for attr_name in dir(cls)
-                if not attr_name.startswith("_")
-                and isinstance(getattr(cls, attr_name), Constant)
-            ]
-            seen = set()
-            for constant in fields:
-                if constant in seen:
-                    raise DuplicateConstantError(constant)
-                seen.add(constant)
-
-            cls._ordered_fields = OrderedDict(
-                sorted(((f._creation_counter, f) for f in fields), key=lambda i: i[0])
-            )
+        return cls.__instance
+
+    def __reduce__(self):
+        # pickled by reference to the class, so unpickled as the singleton
+        return type(self)._get_instance, ()
+
+    @classmethod
+    def _get_instance(cls) -> "Constants":
+        if cls.__instance is None:
+            return cls()
         return cls.__instance
 
     def __iter__(self) -> Generator[C, None, None]:
-        for field in self._ordered_fields.values():
-            yield field
+        yield from self.__snapshot.fields.values()
 
     def __getitem__(self, item: Union[C, T]) -> C:
         return self._value_to_object_mapping[item]
@@ -176,16 +549,56 @@ class Constants(Generic[C], ImmutableMixin):
         return len(self._value_to_object_mapping)
 
     def __setattr__(self, key: str, value: Any) -> None:
-        if not key.startswith("_") and isinstance(value, Constant):
-            counter = value._creation_counter
-            if hasattr(self, key):
-                counter = getattr(self, key)._creation_counter
-            elif value in self:
-                raise DuplicateConstantError(value)
-            self._ordered_fields[counter] = value
-        super().__setattr__(key, value)
+        if key.startswith("_") or not isinstance(value, Constant):
+            super().__setattr__(key, value)
+            return
+        if not getattr(self, "_mutable", True):
+            raise AttributeError("Cannot change constant values.")
+        with self.mutate() as draft:
+            setattr(draft, key, value)
+
+    @contextmanager
+    def mutate(self) -> Generator[ConstantsDraft, None, None]:
+        """
+        Changes the constants without making them mutable, e.g.
+        `with FUNDING_BASES.mutate() as draft: draft.USD_FIXED = ...`.
+        The changes are checked & indexed on the side once the block exits and
+        then published at once, so concurrent lookups either see all of them or
+        none of them and never wait. Mutations are serialised.
+        """
+        with self.__mutation_lock:
+            draft = ConstantsDraft(self.__snapshot.fields)
+            yield draft
+            self._publish(draft._fields)
+
+    def _publish(self, fields: Dict[str, C]) -> None:
+        snapshot = ConstantsSnapshot(fields, self.__snapshot.generation + 1)
+        value_to_object_mapping = {}
+        for key, constant in fields.items():
+            if constant.value in value_to_object_mapping:
+                raise DuplicateConstantError(constant)
+            value_to_object_mapping[constant.value] = constant
+        snapshot.value_to_object_mapping = value_to_object_mapping
+        snapshot.label_to_object_mapping = {
+            attr.label: attr for attr in fields.values()
+        }
+        for position, (key, constant) in enumerate(fields.items()):
+            if constant._ordinal is None:
+                constant._ordinal = position
+            constant._attach(self, key)
+        # the indexes first, readers never see new attributes with old indexes
+        self.__set_snapshot(snapshot)
+        for key, constant in fields.items():
+            if getattr(self, key, None) is not constant:
+                object.__setattr__(self, key, constant)
+
+    def __set_snapshot(self, snapshot: ConstantsSnapshot) -> None:
+        global CONSTANTS_GENERATION
+        self.__snapshot = snapshot
+        # once published, so a cache can't miss it while checking
+        CONSTANTS_GENERATION = next(_constants_generations)
 
-    @lru_cache()
+    @cached_method
     def to_django_choices(self) -> Tuple[Tuple[T, str]]:
         return tuple((attr.value, attr.label) for attr in self)
 
@@ -195,64 +608,383 @@ class Constants(Generic[C], ImmutableMixin):
     def get_label(self, value: T) -> str:
         return self._value_to_object_mapping[value].label
 
-    def get_by_label(self, label: str) -> C:
-        return self._label_to_object_mapping[label]
+    def get_by_label(self, label: str, default: Any = NOT_PROVIDED) -> C:
+        if default is NOT_PROVIDED:
+            return self._label_to_object_mapping[label]
+        return self._label_to_object_mapping.get(label, default)
+
+    def get(self, value: Union[C, T], default: Any = None) -> Union[C, Any]:
+        return self._value_to_object_mapping.get(value, default)
+
+    def get_many(
+        self, values: Iterable[Union[C, T]], on_missing: str = ON_MISSING_RAISE
+    ) -> Tuple[List[Union[C, None]], List[Any]]:
+        """
+        Looks up all the given values in one pass, without raising for each miss.
+        Returns the constants and the values that are missing.
+        `on_missing` decides what happens to the missing values:
+        - "raise": a single KeyError with all the missing values is raised.
+        - "none": None is returned in their place.
+        - "skip": they are left out of the constants.
+        """
+        return get_many(self._value_to_object_mapping, values, on_missing)
+
+    def get_many_by_label(
+        self, labels: Iterable[str], on_missing: str = ON_MISSING_RAISE
+    ) -> Tuple[List[Union[C, None]], List[Any]]:
+        """Same as `get_many` but looks up the constants by label."""
+        return get_many(self._label_to_object_mapping, labels, on_missing)
+
+    def lookup(self, key: Any, default: Any = NOT_PROVIDED) -> C:
+        """
+        Finds the constant for user entered text, e.g. "eur", " Eur " or
+        "3m euribor", by comparing normalized keys (see `normalize_lookup_key`)
+        of the values, the labels and then the `lookup_aliases` attributes.
+        Keys shared by several constants at the same level don't match.
+        Raises a KeyError when nothing matches unless a default is given.
+        """
+        constant = self._lookup_index.get(normalize_lookup_key(key))
+        if constant is None:
+            if default is NOT_PROVIDED:
+                raise KeyError(key)
+            return default
+        return constant
+
+    def sort_key(self, item: Union[C, T]) -> int:
+        """
+        Returns the position of the constant (or its value) in these constants.
+        To be used as `sorted(values, key=CONSTANTS.sort_key)`.
+        """
+        return self._ordinals[item]
+
+    def sort(self, iterable: Iterable[Union[C, T]], reverse=False) -> List[Union[C, T]]:
+        """
+        Sorts the given constants or values in the order they are defined in.
+        Raises a KeyError if an item is not one of these constants.
+        """
+        return sorted(iterable, key=self._ordinals.__getitem__, reverse=reverse)
+
+    def filter(self, **attributes: Any) -> Tuple[C, ...]:
+        """
+        Returns the constants having all the given attribute values, in order.
+        Related attributes can be followed with `__`, for example
+        `FUNDING_BASES.filter(currency__is_g10=True, is_floating_basis=True)`.
+        Constants that don't have an attribute never match it.
+        The attributes are indexed on first use, so they have to be hashable.
+        """
+        if not attributes:
+            return tuple(self)
+        matches = sorted(
+            (
+                self._get_index(lookup).get(value, ())
+                for lookup, value in attributes.items()
+            ),
+            key=len,
+        )
+        if len(matches) == 1:
+            return matches[0]
+        others = [set(map(id, match)) for match in matches[1:]]
+        return tuple(
+            constant
+            for constant in matches[0]
+            if all(id(constant) in other for other in others)
+        )
+
+    def group_by(self, lookup: str) -> Dict[Any, Tuple[C, ...]]:
+        """
+        Groups the constants by the value of the given attribute, which can
+        follow related attributes with `__` like `filter`.
+        """
+        return dict(self._get_index(lookup))
+
+    def encode(self, iterable: Iterable[Union[C, T, None]]) -> "numpy.ndarray":
+        """
+        Returns the ordinals of the given constants (or values) as a numpy array
+        of the smallest integer type that fits. `None` is encoded as -1.
+        Raises a KeyError if an item is not one of these constants.
+        Requires numpy.
+        """
+        import numpy
+
+        ordinals = self._ordinals
+        return numpy.fromiter(
+            (-1 if item is None else ordinals[item] for item in iterable),
+            dtype=self.code_dtype,
+        )
+
+    def decode(self, codes: Iterable[int]) -> "numpy.ndarray":
+        """
+        Inverse of `encode`, returns an object array of the constants (or None
+        for -1) with the same shape as the given codes. Requires numpy.
+        """
+        import numpy
+
+        codes = numpy.asarray(codes)
+        if codes.dtype.kind not in "iu":
+            raise TypeError(f"Codes must be integers, not '{codes.dtype}'.")
+        snapshot = self.__snapshot
+        constants = list(snapshot.fields.values())
+        if codes.size and (codes.min() < -1 or codes.max() >= len(constants)):
+            raise ValueError(f"Codes must be between -1 and {len(constants) - 1}.")
+        if snapshot.decode_table is None:
+            # the last item is returned for -1
+            table = numpy.empty(len(constants) + 1, dtype=object)
+            table[:-1] = constants
+            snapshot.decode_table = table
+        return snapshot.decode_table[codes]
+
+    @property
+    def code_dtype(self) -> "numpy.dtype":
+        """The smallest signed integer type that fits the codes of `encode`."""
+        import numpy
+
+        for dtype in (numpy.int8, numpy.int16, numpy.int32):
+            if len(self) <= numpy.iinfo(dtype).max:
+                return numpy.dtype(dtype)
+        return numpy.dtype(numpy.int64)
+
+    def _get_index(self, lookup: str) -> Dict[Any, Tuple[C, ...]]:
+        snapshot = self.__snapshot
+        index = snapshot.indexes.get(lookup)
+        if index is None:
+            groups = OrderedDict()
+            for constant in snapshot.fields.values():
+                try:
+                    value = get_related_attribute(constant, lookup)
+                except AttributeError:
+                    continue
+                try:
+                    groups.setdefault(value, []).append(constant)
+                except TypeError:
+                    raise TypeError(
+                        f"Cannot index '{lookup}', "
+                        f"'{type(value).__name__}' is not hashable."
+                    )
+            index = {value: tuple(group) for value, group in groups.items()}
+            snapshot.indexes[lookup] = index
+        return index
+
+    @property
+    def generation(self) -> int:
+        """
+        Incremented whenever the constants may have changed: when constants are
+        added or replaced, when they are made mutable or immutable and when an
+        attribute of one of them is set while mutable.
+        """
+        return self.__snapshot.generation
+
+    def _get_cached_results(self) -> Dict[Tuple, Any]:
+        return self.__snapshot.cached_results
+
+    def _invalidate(self) -> None:
+        # under the lock, so the constants of a concurrent `mutate` aren't lost
+        with self.__mutation_lock:
+            self.__set_snapshot(
+                ConstantsSnapshot(
+                    self.__snapshot.fields, self.__snapshot.generation + 1
+                )
+            )
+
+    @property
+    def _ordinals(self) -> Dict[T, int]:
+        snapshot = self.__snapshot
+        if snapshot.ordinals is None:
+            snapshot.ordinals = {
+                attr.value: i for i, attr in enumerate(snapshot.fields.values())
+            }
+        return snapshot.ordinals
 
     @property
     def _value_to_object_mapping(self) -> Dict[T, C]:
-        if self.__value_to_object_mapping is None:
-            self.__value_to_object_mapping = {attr.value: attr for attr in self}
-        return self.__value_to_object_mapping
+        snapshot = self.__snapshot
+        if snapshot.value_to_object_mapping is None:
+            snapshot.value_to_object_mapping = {
+                attr.value: attr for attr in snapshot.fields.values()
+            }
+        return snapshot.value_to_object_mapping
+
+    @property
+    def _lookup_index(self) -> Dict[Any, Union[C, None]]:
+        snapshot = self.__snapshot
+        if snapshot.lookup_index is None:
+            index = {}
+            for attributes in (("value", "label"), self.lookup_aliases):
+                level = {}
+                for constant in snapshot.fields.values():
+                    for attribute in attributes:
+                        key = normalize_lookup_key(getattr(constant, attribute, None))
+                        # keys of previous levels take precedence
+                        if key is None or key in index:
+                            continue
+                        if level.setdefault(key, constant) is not constant:
+                            # ambiguous keys are kept to shadow the next levels
+                            level[key] = None
+                index.update(level)
+            snapshot.lookup_index = index
+        return snapshot.lookup_index
 
     @property
     def _label_to_object_mapping(self) -> Dict[str, C]:
-        if self.__label_to_object_mapping is None:
-            self.__label_to_object_mapping = {attr.label: attr for attr in self}
-        return self.__label_to_object_mapping
+        snapshot = self.__snapshot
+        if snapshot.label_to_object_mapping is None:
+            snapshot.label_to_object_mapping = {
+                attr.label: attr for attr in snapshot.fields.values()
+            }
+        return snapshot.label_to_object_mapping
 
     def make_mutable(self):
         super().make_mutable()
         for constant in self:
             constant.make_mutable()
+        self._invalidate()
 
     def make_immutable(self):
         super().make_immutable()
         for constant in self:
             constant.make_immutable()
+        self._invalidate()
 
-    @lru_cache()
+    @cached_method
     def to_json(self):
         """
         Called when you do `json.dumps` with constants. The return value is
-        cached as constants are immutable.
-
-        If the constant is modified make sure to clear the lru cache.
+        cached until the constants change.
         """
         return [o.to_json() for o in self]
 
+    def enable_instrumentation(
+        self, callback: Callable[["Constants", str, Any, bool], None] = None
+    ) -> None:
+        """
+        Starts counting the lookups & misses of `__getitem__`, `get`,
+        `get_by_label` and `__contains__`, see `stats`. The counts start at 0.
+        `callback` is called with the constants, the name of the method, the
+        key and whether it was found on every lookup, e.g. to export metrics.
+        The instance is switched to an instrumented subclass, so lookups cost
+        nothing extra while instrumentation is disabled.
+        """
+        self._lookup_callback = callback
+        self._lookup_stats = {name: [0, 0] for name in INSTRUMENTED_METHODS}
+        cls = getattr(type(self), "_uninstrumented_class", type(self))
+        self.__class__ = get_instrumented_class(cls)
+
+    def disable_instrumentation(self) -> None:
+        """
+        Stops counting the lookups, the counts so far are still in `stats`.
+        """
+        if isinstance(self, InstrumentedConstants):
+            self.__class__ = self._uninstrumented_class
+        self._lookup_callback = None
+
+    def stats(self) -> Dict[str, LookupStats]:
+        """
+        Returns the lookups & misses counted per method since instrumentation
+        was last enabled, or an empty dict if it never was.
+        Counts may be slightly off when lookups run in several threads.
+        """
+        return {
+            name: LookupStats(*counts)
+            for name, counts in getattr(self, "_lookup_stats", {}).items()
+        }
+
+
+INSTRUMENTED_METHODS = ("__getitem__", "get", "get_by_label", "__contains__")
+
+
+class InstrumentedConstants:
+    """
+    Counts the lookups of the constants it is mixed into, see
+    `Constants.enable_instrumentation`.
+    """
+
+    _uninstrumented_class: type
+
+    def __reduce__(self):
+        return self._uninstrumented_class._get_instance, ()
+
+    def _record_lookup(self, method: str, key: Any, found: bool) -> None:
+        counts = self._lookup_stats[method]
+        counts[0] += 1
+        if not found:
+            counts[1] += 1
+        if self._lookup_callback is not None:
+            self._lookup_callback(self, method, key, found)
+
+    def __getitem__(self, item):
+        try:
+            constant = super().__getitem__(item)
+        except KeyError:
+            self._record_lookup("__getitem__", item, False)
+            raise
+        self._record_lookup("__getitem__", item, True)
+        return constant
+
+    def get(self, value, default=None):
+        constant = super().get(value, NOT_PROVIDED)
+        if constant is NOT_PROVIDED:
+            self._record_lookup("get", value, False)
+            return default
+        self._record_lookup("get", value, True)
+        return constant
+
+    def get_by_label(self, label, default=NOT_PROVIDED):
+        try:
+            constant = super().get_by_label(label)
+        except KeyError:
+            self._record_lookup("get_by_label", label, False)
+            if default is NOT_PROVIDED:
+                raise
+            return default
+        self._record_lookup("get_by_label", label, True)
+        return constant
+
+    def __contains__(self, item):
+        found = super().__contains__(item)
+        self._record_lookup("__contains__", item, found)
+        return found
+
+
+@lru_cache(maxsize=None)
+def get_instrumented_class(cls: type) -> type:
+    """
+    Returns a subclass of the given constants class that counts the lookups,
+    it looks the same as the class, e.g. in reprs & error messages.
+    """
+    return type(
+        cls.__name__,
+        (InstrumentedConstants, cls),
+        {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "_uninstrumented_class": cls,
+        },
+    )
+
 
 def add_sorting_functions(
     constant_cls: type(Constant), constants_iterable: Constants
 ) -> None:
-    def get_compare_value(other) -> Constant:
+    def get_ordinal(other) -> int:
+        # the position in these constants, the ordinal of a constant is its
+        # position in the first constants that declared it, which may differ
         try:
-            return constants_iterable[other]
+            return constants_iterable.sort_key(other)
         except KeyError:
             raise TypeError(
                 f"Cannot compare instances of '{constant_cls.__name__}' and '{type(other).__name__}'"
             )
 
     def __lt__(self, other):
-        return self._creation_counter < get_compare_value(other)._creation_counter
+        return get_ordinal(self) < get_ordinal(other)
 
     def __le__(self, other):
-        return self._creation_counter <= get_compare_value(other)._creation_counter
+        return get_ordinal(self) <= get_ordinal(other)
 
     def __gt__(self, other):
-        return self._creation_counter > get_compare_value(other)._creation_counter
+        return get_ordinal(self) > get_ordinal(other)
 
     def __ge__(self, other):
-        return self._creation_counter >= get_compare_value(other)._creation_counter
+        return get_ordinal(self) >= get_ordinal(other)
 
     constant_cls.__lt__ = __lt__
     constant_cls.__le__ = __le__
@@ -260,6 +992,72 @@ def add_sorting_functions(
     constant_cls.__ge__ = __ge__
 
 
+OPERATOR_FUNCTIONS = {
+    "__add__": operator.add,
+    "__sub__": operator.sub,
+    "__mul__": operator.mul,
+    "__matmul__": operator.matmul,
+    "__truediv__": operator.truediv,
+    "__floordiv__": operator.floordiv,
+    "__mod__": operator.mod,
+    "__divmod__": divmod,
+    "__pow__": pow,
+    "__lshift__": operator.lshift,
+    "__rshift__": operator.rshift,
+    "__and__": operator.and_,
+    "__xor__": operator.xor,
+    "__or__": operator.or_,
+    "__le__": operator.le,
+    "__lt__": operator.lt,
+    "__ge__": operator.ge,
+    "__gt__": operator.gt,
+}
+
+
+def add_operator_methods(constant_cls: type(Constant), value_type: type) -> None:
+    """
+    Adds the `OPERATOR_METHODS` of `value_type` to `constant_cls`, operating on
+    the values like `perform_on_constant`. The methods are made once, with fast
+    paths for a constant of the same type or a `value_type` as other operand.
+    Other operands are passed to the operator as is, so `tenor + date` works.
+    """
+    for name in OPERATOR_METHODS:
+        operation = getattr(value_type, name, None)
+        if operation is None:
+            continue
+        if name in OPERATOR_FUNCTIONS:
+            function, reflected = OPERATOR_FUNCTIONS[name], False
+        else:
+            # e.g. `__radd__` is `add` with the operands swapped
+            function, reflected = OPERATOR_FUNCTIONS[f"__{name[3:]}"], True
+        method = make_operator_method(operation, function, reflected, value_type)
+        method.__name__ = name
+        method.__qualname__ = f"{constant_cls.__qualname__}.{name}"
+        setattr(constant_cls, name, method)
+
+
+def make_operator_method(
+    operation: Callable, function: Callable, reflected: bool, value_type: type
+) -> Callable:
+    # the operator function is several times faster than calling the slot
+    # wrapper `operation`, and it also tries the reflected method of `other`
+    operate = perform_on_constant(operation)
+
+    def method(self, other, *optional):
+        if optional:
+            return operate(self, other, *optional)
+        other_type = type(other)
+        if other_type is type(self):
+            other = other.value
+        elif other_type is not value_type and isinstance(other, Constant):
+            return operate(self, other)
+        if reflected:
+            return function(other, self.value)
+        return function(self.value, other)
+
+    return method
+
+
 def encode_default(self, obj):
     if isinstance(obj, (Constant, Constants)):
         return obj.to_json()
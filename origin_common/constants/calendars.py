@@ -2,6 +2,8 @@ from origin_common.constants.base import Constant, Constants, add_sorting_functi
 
 
 class Calendar(Constant[str]):
+    __slots__ = ()
+
     def __init__(self, value: str):
         label = value
         super().__init__(value, label)
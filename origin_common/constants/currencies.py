@@ -1,11 +1,17 @@
-from functools import lru_cache
 from typing import Tuple, Union
 
-from origin_common.constants.base import Constant, Constants, add_sorting_functions
+from origin_common.constants.base import (
+    Constant,
+    Constants,
+    add_sorting_functions,
+    cached_method,
+)
 from origin_common.constants.calendars import CALENDARS, Calendar
 
 
 class Currency(Constant[str]):
+    __slots__ = ("name", "symbol", "is_g10", "related_calendars")
+
     def __init__(
         self,
         value: str,
@@ -299,10 +305,10 @@ class Currencies(Constants[Currency]):
         # symbol="K",
     )
 
-    @lru_cache()
+    @cached_method
     def to_django_choices(self, only_g10=False) -> Tuple[Tuple[str, str]]:
         if only_g10:
-            return tuple((attr.value, attr.label) for attr in self if attr.is_g10)
+            return tuple((attr.value, attr.label) for attr in self.filter(is_g10=True))
         return super().to_django_choices()
 
     def get_name(self, value: Union[str, Currency]) -> str:
@@ -2,7 +2,7 @@ from origin_common.constants.base import Constant, Constants, add_sorting_functi
 
 
 class DayCount(Constant[str]):
-    pass
+    __slots__ = ()
 
 
 class DayCounts(Constants):
@@ -80,16 +80,14 @@ class ConstantField(models.Field):
         return self.type_mappings[self.base_type].__name__
 
     def to_python(self, value: Union[None, base_type]) -> Union[Constant, None]:
-        try:
-            constant = self.constants[value]
-        except KeyError:
+        constant = self.constants.get(value)
+        if constant is None:
             if value in {None, ""}:
                 # for nullable/blank values
                 return value
             raise ValidationError(f"Invalid input: '{value}' is not a valid constant.")
-        else:
-            constant.make_immutable()
-            return constant
+        constant.make_immutable()
+        return constant
 
     def get_prep_value(
         self, value: Union[Constant, base_type, None]
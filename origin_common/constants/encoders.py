@@ -0,0 +1,210 @@
+from collections.abc import Iterator
+from itertools import islice
+from json import JSONEncoder
+from threading import local
+from typing import Any, Dict, Union
+
+import origin_common.constants
+from origin_common.constants import base
+from origin_common.constants.base import Constant, Constants
+
+
+def json_default(obj):
+    """
+    `default` hook for JSON libraries like orjson or ujson, e.g.
+    `orjson.dumps(trades, default=json_default)`.
+    """
+    if isinstance(obj, (Constant, Constants)):
+        return obj.to_json()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ConstantsJSONEncoder(JSONEncoder):
+    """
+    Encoder for payloads with many constants, e.g.
+    `json.dumps(trades, cls=ConstantsJSONEncoder)`.
+
+    The JSON value of every constant is computed once per encoder, so create a
+    new encoder if constants are changed. Lists and iterators are streamed by
+    `iterencode` in batches of `batch_size` items, each batch is encoded by the
+    C encoder instead of the pure python one `json.dump` uses.
+    """
+
+    def __init__(self, *args, batch_size=1000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_size = batch_size
+        self._values = {}
+        self._fragments = {}
+        # keeps the cached constants alive so their ids can't be reused
+        self._constants = []
+
+    def default(self, obj):
+        try:
+            return self._values[id(obj)]
+        except KeyError:
+            pass
+        if isinstance(obj, (Constant, Constants)):
+            value = self._values[id(obj)] = obj.to_json()
+            self._constants.append(obj)
+            return value
+        return super().default(obj)
+
+    def iterencode(self, o, _one_shot=False):
+        if isinstance(o, Constant):
+            return iter((self._encode_constant(o),))
+        if isinstance(o, Iterator) or (not _one_shot and isinstance(o, (list, tuple))):
+            if self.indent is not None:
+                return super().iterencode(list(o), _one_shot)
+            return self._iterencode_batches(o)
+        return super().iterencode(o, _one_shot)
+
+    def _encode_constant(self, constant):
+        try:
+            return self._fragments[id(constant)]
+        except KeyError:
+            fragment = super().encode(self.default(constant))
+            self._fragments[id(constant)] = fragment
+            return fragment
+
+    def _iterencode_batches(self, items):
+        items = iter(items)
+        yield "["
+        batch = list(islice(items, self.batch_size))
+        if batch:
+            # encoding the batch as a list goes through the C encoder, the
+            # brackets are stripped so the batches join into a single list
+            yield self.encode(batch)[1:-1]
+        while True:
+            batch = list(islice(items, self.batch_size))
+            if not batch:
+                break
+            yield self.item_separator
+            yield self.encode(batch)[1:-1]
+        yield "]"
+
+
+DEFAULT_EXT_CODES = {
+    1: "CURRENCIES",
+    2: "TENORS",
+    3: "FUNDING_BASES",
+    4: "CD_FUNDING_BASES",
+    5: "MTN_FUNDING_BASES",
+    6: "CALENDARS",
+    7: "DAY_COUNTS",
+    8: "PAYMENT_FREQUENCIES",
+    9: "ADJUSTMENTS",
+    10: "BUSINESS_DAY_CONVENTIONS",
+}
+
+
+class MsgpackCodec:
+    """
+    Encodes constants as msgpack ext types, the ext type code identifies the
+    constants and the data is the position of the constant in them (1 byte for
+    up to 256 constants, 2 bytes above), e.g.
+    `msgpack.packb(quote, default=codec.default)` and
+    `msgpack.unpackb(data, ext_hook=codec.ext_hook)` which returns the same
+    constant objects. Requires msgpack. The tables of the constants are checked
+    once per message by `packb` and `unpackb`, and once per constant by the hooks.
+
+    `ext_codes` maps the ext type codes (0 to 127) to the constants or the name
+    of one of the constants of `origin_common.constants`, by default
+    `DEFAULT_EXT_CODES`. Both sides have to use the same codes and versions of
+    the constants, new constants have to be added at the end.
+    """
+
+    def __init__(self, ext_codes: Dict[int, Union[Constants, str]] = None):
+        if ext_codes is None:
+            ext_codes = DEFAULT_EXT_CODES
+        for code in ext_codes:
+            if not 0 <= code <= 127:
+                raise ValueError(
+                    f"Ext type codes must be between 0 and 127, not {code}."
+                )
+        import msgpack
+
+        self.ext_codes = dict(ext_codes)
+        self._msgpack = msgpack
+        # the generation, the encode table, the decode tables & the encoded
+        # constants, kept alive so their ids can't be reused. They are replaced
+        # together so that the tables always match their generation.
+        self._tables = (None, {}, {}, [])
+        self._local = local()
+
+    def packb(self, obj: Any) -> bytes:
+        self._update_tables()
+        try:
+            packer = self._local.packer
+        except AttributeError:
+            # creating a packer is as slow as packing a small message
+            packer = self._local.packer = self._msgpack.Packer(
+                default=self._encode, use_bin_type=True
+            )
+        return packer.pack(obj)
+
+    def unpackb(self, data: bytes) -> Any:
+        self._update_tables()
+        return self._msgpack.unpackb(data, ext_hook=self._decode, raw=False)
+
+    def default(self, obj: Any) -> "msgpack.ExtType":
+        self._update_tables()
+        return self._encode(obj)
+
+    def ext_hook(self, code: int, data: bytes) -> Any:
+        self._update_tables()
+        return self._decode(code, data)
+
+    def _encode(self, obj: Any) -> "msgpack.ExtType":
+        ext_type = self._tables[1].get(id(obj))
+        if ext_type is None:
+            raise TypeError(f"Cannot encode {obj!r}, it isn't in any of the constants.")
+        return ext_type
+
+    def _decode(self, code: int, data: bytes) -> Any:
+        table = self._tables[2].get(code)
+        if table is None:
+            return self._msgpack.ExtType(code, data)
+        constant = table.get(data)
+        if constant is None:
+            raise ValueError(
+                f"{type(self.ext_codes[code]).__name__} has no constant at position "
+                f"{int.from_bytes(data, 'big')}."
+            )
+        return constant
+
+    def _update_tables(self) -> None:
+        """
+        Rebuilds the tables of all the constants when any of them changed, once
+        per message rather than for each constant in it.
+        """
+        generation = base.CONSTANTS_GENERATION
+        if generation == self._tables[0]:
+            return
+        for code, constants in self.ext_codes.items():
+            if isinstance(constants, str):
+                self.ext_codes[code] = getattr(origin_common.constants, constants)
+        encode_table, decode_tables, encoded_constants = {}, {}, []
+        for code, constants in self.ext_codes.items():
+            decode_table = decode_tables[code] = {}
+            for constant in constants:
+                ext_type = self._to_ext_type(code, constants, constant)
+                if ext_type is None:
+                    continue
+                decode_table[ext_type.data] = constant
+                # the first ext type code is used for constants in several constants
+                if id(constant) not in encode_table:
+                    encode_table[id(constant)] = ext_type
+                    encoded_constants.append(constant)
+        self._tables = (generation, encode_table, decode_tables, encoded_constants)
+
+    def _to_ext_type(
+        self, code: int, constants: Constants, constant: Constant
+    ) -> "msgpack.ExtType":
+        try:
+            if constants.get(constant.value) is not constant:
+                return None
+        except TypeError:
+            return None
+        position = constants.sort_key(constant.value)
+        size = 1 if position < 0x100 else 2 if position < 0x10000 else 4
+        return self._msgpack.ExtType(code, position.to_bytes(size, "big"))
@@ -1,9 +1,13 @@
 from datetime import time
-from functools import lru_cache
 from typing import List, Tuple
 
 from origin_common.constants.adjustments import ADJUSTMENTS, Adjustment
-from origin_common.constants.base import Constant, Constants, add_sorting_functions
+from origin_common.constants.base import (
+    Constant,
+    Constants,
+    add_sorting_functions,
+    cached_method,
+)
 from origin_common.constants.business_day_conventions import (
     BUSINESS_DAY_CONVENTIONS,
     BusinessDayConvention,
@@ -26,6 +30,14 @@ BASIS_TYPE_FLOATING = "floating"
 
 
 class FixingInfo(Constant[str]):
+    __slots__ = (
+        "benchmark_base",
+        "days_prior_to_fixing",
+        "fixing_time",
+        "fixing_location",
+        "calendar",
+    )
+
     def __init__(
         self,
         benchmark_base: str,
@@ -140,6 +152,20 @@ JIBAR = FixingInfo(
 
 
 class FundingBasis(Constant[str]):
+    __slots__ = (
+        "currency",
+        "payment_frequency",
+        "day_count",
+        "sorting",
+        "adjustment",
+        "business_day_convention",
+        "pricing",
+        "calendars_for_payment",
+        "is_callable_basis",
+        "index",
+        "basis_type",
+    )
+
     def __init__(
         self,
         value: str,
@@ -188,6 +214,8 @@ class FundingBasis(Constant[str]):
 
 
 class FloatingFundingBasis(FundingBasis):
+    __slots__ = ("screen_page", "legal_label", "fixing_info")
+
     def __init__(
         self,
         *args,
@@ -211,6 +239,8 @@ class FloatingFundingBasis(FundingBasis):
 
 
 class FixedFundingBasis(FundingBasis):
+    __slots__ = ("legal_label",)
+
     def __init__(
         self,
         currency: Currency,
@@ -248,6 +278,13 @@ class FixedFundingBasis(FundingBasis):
 
 
 class MSFundingBasis(FundingBasis):
+    __slots__ = (
+        "floating_basis",
+        "display_payment_frequency",
+        "ms_payment_frequency",
+        "ms_day_count",
+    )
+
     def __init__(
         self,
         currency: Currency,
@@ -289,6 +326,8 @@ class MSFundingBasis(FundingBasis):
 
 
 class GovieFundingBasis(FundingBasis):
+    __slots__ = ("issuer_short_name",)
+
     def __init__(self, *args, issuer_short_name: str, **kwargs):
         super().__init__(*args, **kwargs)
         self.basis_type = BASIS_TYPE_GOVIE
@@ -300,6 +339,8 @@ class GovieFundingBasis(FundingBasis):
 
 
 class FundingBases(Constants[FundingBasis]):
+    lookup_aliases = ("legal_label", "screen_page")
+
     EUR_3M = FloatingFundingBasis(
         value="3M_EUR",
         label="3mEURIBOR",
@@ -1068,7 +1109,7 @@ class FundingBases(Constants[FundingBasis]):
         calendars_for_payment=[CALENDARS.TARGET2],
     )
 
-    @lru_cache()
+    @cached_method
     def to_django_choices(
         self, is_callable_basis=None, pricing=None
     ) -> Tuple[Tuple[str, str]]:
@@ -1078,12 +1119,7 @@ class FundingBases(Constants[FundingBasis]):
         if pricing is not None:
             properties_to_check["pricing"] = pricing
         return tuple(
-            (basis.value, basis.label)
-            for basis in self
-            if all(
-                getattr(basis, attr) == value
-                for attr, value in properties_to_check.items()
-            )
+            (basis.value, basis.label) for basis in self.filter(**properties_to_check)
         )
 
 
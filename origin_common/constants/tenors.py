@@ -1,12 +1,8 @@
 import re
 from datetime import timedelta
 
-from origin_common.constants.base import (
-    OPERATOR_METHODS,
-    Constant,
-    Constants,
-    perform_on_constant,
-)
+from origin_common.constants.base import Constant, Constants, add_operator_methods
+from origin_common.periods import DAY, MONTH, YEAR, Period, timedelta_to_period
 
 SECONDS_IN_A_DAY = 86400.0
 DAYS_IN_A_YEAR = 365.25
@@ -14,39 +10,44 @@ DAYS_IN_A_MONTH = DAYS_IN_A_YEAR / 12
 DAYS_IN_A_WEEK = DAYS_IN_A_YEAR / 52
 
 
+TENOR_LABEL_REGEX = re.compile(r"([\d\.]+)(M|Y|W)")
+
 ONE_MONTH_TIMEDELTA = timedelta(days=1 * DAYS_IN_A_MONTH)
 THREE_MONTH_TIMEDELTA = timedelta(days=3 * DAYS_IN_A_MONTH)
 ONE_YEAR_TIMEDELTA = timedelta(days=1 * DAYS_IN_A_YEAR)
+ONE_DAY_LENGTH = Period(1, DAY).length
+ONE_MONTH_LENGTH = Period(1, MONTH).length
+THREE_MONTH_LENGTH = Period(3, MONTH).length
+ONE_YEAR_LENGTH = Period(1, YEAR).length
 
 
 class Tenor(Constant[timedelta]):
-    __dunders_already_set = False
-
-    def __new__(cls, *args, **kwargs):
-        obj = super().__new__(cls, *args, **kwargs)
-        if cls.__dunders_already_set:
-            return obj
-
-        for attr in OPERATOR_METHODS:
-            try:
-                operation = getattr(timedelta, attr)
-            except AttributeError:
-                pass
-            else:
-                setattr(cls, attr, perform_on_constant(operation))
-        cls.__dunders_already_set = True
-        return obj
+    __slots__ = ("color_code", "number_of_months", "_period")
 
     def __init__(self, value: timedelta, label: str, color_code: str):
         super().__init__(value, label)
         self.color_code = color_code
         self.number_of_months = self.get_tenor_months_calculation()
+        self._period = None
+
+    @property
+    def period(self) -> Period:
+        """
+        The exact Period of the tenor, None if its value isn't a whole number of
+        months, weeks or days.
+        """
+        # cached with the value it is the period of, the value can be changed
+        # while the tenors are mutable
+        cache = self._period
+        if cache is None or cache[0] is not self.value:
+            cache = (self.value, timedelta_to_period(self.value))
+            self._period = cache
+        return cache[1]
 
     def get_tenor_months_calculation(self) -> float:
         if self.label == "O/N":
             return 1 / float(DAYS_IN_A_MONTH)  # 1 day is 1/30 months
-        regex = r"([\d\.]+)(M|Y|W)"
-        match = re.match(regex, self.label)
+        match = TENOR_LABEL_REGEX.match(self.label)
         if not match:
             raise ValueError("Invalid tenor")
         number, duration_unit = match.groups()
@@ -61,6 +62,16 @@ class Tenor(Constant[timedelta]):
 
     @property
     def is_callable_tenor(self):
+        cache = self._period
+        period = cache[1] if cache and cache[0] is self.value else self.period
+        if period is not None:
+            # the same checks on the exact length of the period
+            length = period.length
+            return (
+                length >= ONE_YEAR_LENGTH
+                or length % THREE_MONTH_LENGTH < ONE_DAY_LENGTH
+                or length == ONE_MONTH_LENGTH
+            )
         return (
             self.value >= ONE_YEAR_TIMEDELTA
             or (self.value % THREE_MONTH_TIMEDELTA).days == 0
@@ -74,6 +85,9 @@ class Tenor(Constant[timedelta]):
         return self.value.total_seconds()
 
 
+add_operator_methods(Tenor, timedelta)
+
+
 class Tenors(Constants[Tenor]):
     OVERNIGHT = Tenor(timedelta(days=1), "O/N", "#665241")
     ONE_WEEK = Tenor(timedelta(days=1 * DAYS_IN_A_WEEK), "1W", "#C1B591")
@@ -0,0 +1,189 @@
+from datetime import timedelta
+from functools import lru_cache
+
+from origin_common.text import join_list
+
+DAYS_IN_A_YEAR = 365.25
+DAYS_IN_A_MONTH = DAYS_IN_A_YEAR / 12
+DAYS_IN_A_WEEK = DAYS_IN_A_YEAR / 52
+
+DAY = "D"
+WEEK = "W"
+MONTH = "M"
+YEAR = "Y"
+PERIOD_UNIT_DAYS = {DAY: 1, WEEK: DAYS_IN_A_WEEK, MONTH: DAYS_IN_A_MONTH}
+# the length of the units in 1/624 days, the longest length that days, weeks
+# (1461/208 days) & months (1461/48 days) are all whole multiples of
+PERIOD_UNIT_LENGTHS = {DAY: 624, WEEK: 4383, MONTH: 18993}
+PERIOD_CACHE_SIZE = 1024
+ONE_MICROSECOND = timedelta(microseconds=1)
+DAY_MICROSECONDS = timedelta(days=1) // ONE_MICROSECOND
+MONTH_MICROSECONDS = timedelta(days=DAYS_IN_A_MONTH) // ONE_MICROSECOND
+WEEK_MICROSECONDS = DAYS_IN_A_WEEK * DAY_MICROSECONDS
+
+
+class Period:
+    """
+    An exact duration of a whole number of days, weeks or months, e.g.
+    `Period(3, "M")`, years are kept as 12 months. Unlike their timedeltas,
+    which are rounded to microseconds, periods are compared, hashed, added &
+    divided exactly, by their `length` in 1/624 days. A TypeError is raised when
+    the result of periods of different units isn't a whole number of months,
+    weeks or days.
+    """
+
+    __slots__ = ("count", "unit", "length")
+
+    def __init__(self, count: int, unit: str):
+        if not isinstance(count, int):
+            raise TypeError(f"The count of a period must be an int, not {count!r}.")
+        if unit == YEAR:
+            count, unit = count * 12, MONTH
+        if unit not in PERIOD_UNIT_LENGTHS:
+            raise ValueError(
+                f"The unit of a period must be one of "
+                f"{join_list((DAY, WEEK, MONTH, YEAR))}, not '{unit}'."
+            )
+        object.__setattr__(self, "count", count)
+        object.__setattr__(self, "unit", unit)
+        object.__setattr__(self, "length", count * PERIOD_UNIT_LENGTHS[unit])
+
+    def __setattr__(self, key, value):
+        # periods are hashed, like constants they can't be changed
+        raise AttributeError("Cannot change periods.")
+
+    def __reduce__(self):
+        return Period, (self.count, self.unit)
+
+    @classmethod
+    def from_length(cls, length: int) -> "Period":
+        """
+        Returns the period of `length` in the longest of months, weeks & days it
+        is a whole number of, raises a ValueError when it is none of them.
+        """
+        for unit in (MONTH, WEEK, DAY):
+            count, remainder = divmod(length, PERIOD_UNIT_LENGTHS[unit])
+            if not remainder:
+                return cls(count, unit)
+        raise ValueError(f"{length}/624 days isn't a whole number of days.")
+
+    def to_timedelta(self) -> timedelta:
+        """
+        Returns the timedelta of the period, the same as `string_to_timedelta`.
+        """
+        return timedelta(days=self.count * PERIOD_UNIT_DAYS[self.unit])
+
+    def __repr__(self):
+        return f"Period({self.count}, '{self.unit}')"
+
+    def __str__(self):
+        # imported here, the constants import periods without the tenor parsing
+        from origin_common.utils import timedelta_to_string
+
+        return timedelta_to_string(self)
+
+    def __hash__(self):
+        return hash(self.length)
+
+    def __bool__(self):
+        return self.count != 0
+
+    def __eq__(self, other):
+        if isinstance(other, Period):
+            return self.length == other.length
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, Period):
+            return self.length != other.length
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Period):
+            return self.length < other.length
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, Period):
+            return self.length <= other.length
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, Period):
+            return self.length > other.length
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, Period):
+            return self.length >= other.length
+        return NotImplemented
+
+    def __add__(self, other):
+        if not isinstance(other, Period):
+            return NotImplemented
+        if self.unit == other.unit:
+            return Period(self.count + other.count, self.unit)
+        return self.__across_units("+", other, self.length + other.length)
+
+    def __sub__(self, other):
+        if not isinstance(other, Period):
+            return NotImplemented
+        if self.unit == other.unit:
+            return Period(self.count - other.count, self.unit)
+        return self.__across_units("-", other, self.length - other.length)
+
+    def __mul__(self, other):
+        if not isinstance(other, int):
+            return NotImplemented
+        return Period(self.count * other, self.unit)
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        if not isinstance(other, Period):
+            return NotImplemented
+        return self.length // other.length
+
+    def __mod__(self, other):
+        if not isinstance(other, Period):
+            return NotImplemented
+        if self.unit == other.unit:
+            return Period(self.count % other.count, self.unit)
+        return self.__across_units("%", other, self.length % other.length)
+
+    def __across_units(self, operator, other, length):
+        try:
+            return Period.from_length(length)
+        except ValueError:
+            raise TypeError(
+                f"{self!r} {operator} {other!r} isn't a whole number of months, "
+                f"weeks or days, use the timedeltas of the periods instead."
+            ) from None
+
+
+@lru_cache(maxsize=PERIOD_CACHE_SIZE)
+def period_timedelta(count, unit):
+    """
+    Same as `Period(count, unit).to_timedelta()`, cached for the parsing of
+    tenors.
+    """
+    return Period(count, unit).to_timedelta()
+
+
+def timedelta_to_period(duration):
+    """
+    Returns the period a timedelta is the view of, in the longest of months,
+    weeks & days it is a whole number of, or None, e.g. for "1.1Y".
+    """
+    microseconds = duration // ONE_MICROSECOND
+    count, remainder = divmod(microseconds, MONTH_MICROSECONDS)
+    if not remainder:
+        return Period(count, MONTH)
+    # weeks aren't a whole number of microseconds, their timedeltas are rounded
+    count = round(microseconds / WEEK_MICROSECONDS)
+    if period_timedelta(count, WEEK) == duration:
+        return Period(count, WEEK)
+    count, remainder = divmod(microseconds, DAY_MICROSECONDS)
+    if not remainder:
+        return Period(count, DAY)
+    return None
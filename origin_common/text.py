@@ -0,0 +1,16 @@
+def join_list(
+    object_list: list, delimiter: str = ", ", last_delimiter: str = " & "
+) -> str:
+    """
+    Takes a list ["a", "b", "c"] and returns a string "a, b & c"
+    :param object_list: The list that needs to be joined
+    :param last_delimiter: The string to join the last element with the rest of the string
+    :param delimiter: The string to join all the elements (except last) of the list
+    """
+    if not object_list:
+        return ""
+    list_copy = list(object_list)
+    last = list_copy.pop()
+    if list_copy:
+        return f"{delimiter.join(list_copy)}{last_delimiter}{last}"
+    return f"{last}"
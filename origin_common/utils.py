@@ -1,10 +1,26 @@
 import re
 from datetime import timedelta
+from functools import lru_cache
+
+from origin_common.periods import (
+    DAY,
+    DAY_MICROSECONDS,
+    DAYS_IN_A_MONTH,
+    DAYS_IN_A_WEEK,
+    DAYS_IN_A_YEAR,
+    MONTH,
+    MONTH_MICROSECONDS,
+    ONE_MICROSECOND,
+    PERIOD_UNIT_LENGTHS,
+    WEEK,
+    YEAR,
+    Period,
+    period_timedelta,
+    timedelta_to_period,
+)
+from origin_common.text import join_list
 
 SECONDS_IN_A_DAY = 86400.0
-DAYS_IN_A_YEAR = 365.25
-DAYS_IN_A_MONTH = DAYS_IN_A_YEAR / 12
-DAYS_IN_A_WEEK = DAYS_IN_A_YEAR / 52
 TIMEDELTA_STRING_REGEX = re.compile(
     r"^\s*(?:nc)?\s*(\d+(?:\.\d+)?)\s*(m(?:onths?)?"
     r"|y(?:ea)?(?:rs?)?|w(?:ee)?(?:ks?)?)?\*?\s*$",
@@ -22,21 +38,41 @@ def expand_duration_unit(unit):
     return unit
 
 
-def __get_duration_units(duration, round_ndigits=None, only_quarter_years=True):
+def __get_duration_units(duration, only_quarter_years=True):
+    months, remainder = divmod(duration // ONE_MICROSECOND, MONTH_MICROSECONDS)
+    if not remainder and months > 0:
+        # whole months are exact, their units are picked without float math
+        if months < 12 or (only_quarter_years and months % 3):
+            return "M", float(months)
+        return "Y", months / 12
     total_days = duration.total_seconds() / SECONDS_IN_A_DAY
     if total_days < DAYS_IN_A_MONTH:
-        value, units = (total_days // DAYS_IN_A_WEEK), "W"
-    elif total_days < DAYS_IN_A_YEAR or (
+        return "W", total_days // DAYS_IN_A_WEEK
+    if total_days < DAYS_IN_A_YEAR or (
         only_quarter_years and duration % timedelta(days=3 * DAYS_IN_A_MONTH)
     ):
-        value, units = (total_days / DAYS_IN_A_MONTH), "M"
-    else:
-        value, units = (total_days / DAYS_IN_A_YEAR), "Y"
+        return "M", total_days / DAYS_IN_A_MONTH
+    return "Y", total_days / DAYS_IN_A_YEAR
+
+
+def __format_duration_units(
+    units, value, only_initial=True, round_ndigits=None, for_quantlib=False
+):
     if round_ndigits is not None:
         value = round(value, round_ndigits)
     if value.is_integer():
         value = int(value)
-    return units, value
+    if for_quantlib and isinstance(value, float):
+        int_part, decimal_part = str(value).split(".")
+        return "{}{}".format(
+            timedelta_to_string(string_to_timedelta(f"{int_part}{units}")),
+            timedelta_to_string(string_to_timedelta(f"0.{decimal_part}{units}")),
+        )
+    if only_initial:
+        return f"{value}{units}"
+    if value > 1:
+        return f"{value} {expand_duration_unit(units)}s"
+    return f"{value} {expand_duration_unit(units)}"
 
 
 def __get_number_of_day(units):
@@ -50,60 +86,370 @@ def __get_number_of_day(units):
     return multiplier
 
 
-def join_list(
-    object_list: list, delimiter: str = ", ", last_delimiter: str = " & "
-) -> str:
+def string_to_period(input_string):
     """
-    Takes a list ["a", "b", "c"] and returns a string "a, b & c"
-    :param object_list: The list that needs to be joined
-    :param last_delimiter: The string to join the last element with the rest of the string
-    :param delimiter: The string to join all the elements (except last) of the list
+    Takes a tenor like "3M", "1.5Y" or "O/N" and returns its Period, tenors in
+    weeks are kept in weeks. Raises a ValueError for ranges & tenors that aren't
+    a whole number of months, weeks or days, like "1.1Y".
     """
-    if not object_list:
-        return ""
-    list_copy = list(object_list)
-    last = list_copy.pop()
-    if list_copy:
-        return f"{delimiter.join(list_copy)}{last_delimiter}{last}"
-    return f"{last}"
+    parsed = string_to_timedelta(input_string, return_units=True)
+    if isinstance(parsed[1], timedelta):
+        raise ValueError(f'Invalid period "{input_string}", it is a range!')
+    duration, units = parsed
+    period = timedelta_to_period(duration)
+    if period is None:
+        raise ValueError(f'Invalid period "{input_string}"!')
+    if units and units[0] in "wW" and period.unit == MONTH:
+        return Period(period.length // PERIOD_UNIT_LENGTHS[WEEK], WEEK)
+    return period
+
+
+TENOR_CACHE_SIZE = 1024
+
+try:
+    __is_ascii = str.isascii
+except AttributeError:  # python < 3.7
+
+    def __is_ascii(string):
+        try:
+            string.encode("ascii")
+        except UnicodeEncodeError:
+            return False
+        return True
 
 
 def string_to_timedelta(input_string, return_units=False):
+    """
+    Takes a tenor like "3M", "1Y", "O/N" or a range like "1-3Y" and returns a
+    timedelta or a tuple of the start & end timedelta of the range.
+    Parsed strings are cached, ASCII strings that only differ in case or
+    surrounding whitespace share a cache entry, see `set_tenor_cache_size`.
+    """
     if isinstance(input_string, timedelta):
         return input_string
 
-    split_input = input_string.split("-", maxsplit=1)
-    if len(split_input) == 2:
-        start, start_unit = string_to_timedelta(split_input[0], return_units=True)
-        end, end_unit = string_to_timedelta(split_input[1], return_units=True)
-
-        if start_unit is None:
-            total_days = (
-                start.total_seconds()
-                / SECONDS_IN_A_DAY
-                / DAYS_IN_A_YEAR
-                * __get_number_of_day(end_unit)
-            )
-            start = timedelta(days=total_days)
-        if end < start:
-            raise ValueError(f'Invalid input "{input_string}"!')
-        return start, end
+    key = input_string.strip()
+    if __is_ascii(key):
+        # upper casing other strings can change how they parse, e.g. "overnıght"
+        # (dotless i) would become "OVERNIGHT", so they are cached as they are
+        key = key.upper()
+    try:
+        parsed = __cached_parse_tenor(key)
+    except ValueError as error:
+        # the invalid part as given rather than upper cased
+        start, end = error.span
+        error.args = (f'Invalid input "{input_string.lstrip()[start:end]}"!',)
+        raise
+    if isinstance(parsed[1], timedelta):
+        # ranges are returned without units
+        return parsed
+    if not return_units:
+        return parsed[0]
+    duration, units = parsed
+    if units is not None and units != "O/N":
+        # the units are returned as given rather than upper cased
+        units = input_string.strip().rstrip("*")[-len(units) :]
+    return duration, units
 
-    match = TIMEDELTA_STRING_REGEX.match(input_string)
-    if not match:
-        input_string = input_string.strip()
-        if input_string.lower() == "overnight" or input_string.upper() == "O/N":
-            if return_units:
-                return timedelta(days=1), "O/N"
-            return timedelta(days=1)
-        raise ValueError(f'Invalid input "{input_string}"!')
 
-    period_start, units = match.groups()
+def __parse_tenor(input_string):
+    """
+    Parses a tenor like "3M", " nc 10 years*" or "O/N" and returns its timedelta
+    & units, or a range like "1-3Y" and returns its start & end timedelta.
+    The string is read once, character by character, only the units are copied.
+    """
+    length = len(input_string)
+    dash = input_string.find("-")
+    if dash == -1:
+        return __parse_single_tenor(input_string, 0, length)
+    if input_string.find("-", dash + 1) != -1:
+        raise __invalid_input(input_string, 0, len(input_string))
 
-    multiplier = __get_number_of_day(units)
-    if return_units:
-        return timedelta(days=float(period_start) * multiplier), units
-    return timedelta(days=float(period_start) * multiplier)
+    start, start_unit = __parse_single_tenor(input_string, 0, dash)
+    end, end_unit = __parse_single_tenor(input_string, dash + 1, length)
+    if start_unit is None:
+        total_days = (
+            start.total_seconds()
+            / SECONDS_IN_A_DAY
+            / DAYS_IN_A_YEAR
+            * __get_number_of_day(end_unit)
+        )
+        start = timedelta(days=total_days)
+    if end < start:
+        raise __invalid_input(input_string, 0, len(input_string))
+    return start, end
+
+
+def __invalid_input(input_string, start, end):
+    """
+    The error of an invalid tenor, its `span` is where the invalid part is.
+    """
+    error = ValueError(f'Invalid input "{input_string[start:end]}"!')
+    error.span = (start, end)
+    return error
+
+
+# the characters matched by the letters of the tenor grammar regardless of case,
+# like TIMEDELTA_STRING_REGEX does
+__S = "sS\u017f"
+__K = "kK\u212a"
+__ONTH = ("oO", "nN", "tT", "hH")
+__EA = ("eE", "aA")
+__EE = ("eE", "eE")
+__O_N = ("oO", "/", "nN")
+__OVERNIGHT = tuple(char + char.upper() for char in "overnight")
+__DIGITS = {str(digit): digit for digit in range(10)}
+
+
+def __match_word(input_string, position, end, word):
+    """
+    Returns the position after `word` if it is at `position`, else `position`.
+    """
+    stop = position + len(word)
+    if stop > end:
+        return position
+    for offset, chars in enumerate(word):
+        if input_string[position + offset] not in chars:
+            return position
+    return stop
+
+
+def __parse_single_tenor(input_string, start, end):
+    """
+    Parses the tenor between `start` & `end`, following TIMEDELTA_STRING_REGEX.
+    """
+    while start < end and input_string[start].isspace():
+        start += 1
+    while end > start and input_string[end - 1].isspace():
+        end -= 1
+
+    position = start
+    if (
+        position + 1 < end
+        and input_string[position] in "nN"
+        and input_string[position + 1] in "cC"
+    ):
+        position += 2
+        while position < end and input_string[position].isspace():
+            position += 1
+
+    number = 0
+    decimals = 0
+    number_start = position
+    while position < end:
+        digit = __DIGITS.get(input_string[position])
+        if digit is None:
+            if not input_string[position].isdecimal():
+                break
+            digit = int(input_string[position])
+        number = number * 10 + digit
+        position += 1
+    if position == number_start:
+        if start < end and (
+            __match_word(input_string, start, end, __O_N) == end
+            or __match_word(input_string, start, end, __OVERNIGHT) == end
+        ):
+            return period_timedelta(1, DAY), "O/N"
+        raise __invalid_input(input_string, start, end)
+    if position < end and input_string[position] == ".":
+        position += 1
+        fraction_start = position
+        while position < end:
+            digit = __DIGITS.get(input_string[position])
+            if digit is None:
+                if not input_string[position].isdecimal():
+                    break
+                digit = int(input_string[position])
+            number = number * 10 + digit
+            position += 1
+        if position == fraction_start:
+            raise __invalid_input(input_string, start, end)
+        decimals = position - fraction_start
+    while position < end and input_string[position].isspace():
+        position += 1
+
+    units_start = position
+    unit = YEAR
+    multiplier = DAYS_IN_A_YEAR
+    if position < end:
+        char = input_string[position]
+        # most units are a single letter, longer ones are matched past it
+        if char in "mM":
+            unit = MONTH
+            multiplier = DAYS_IN_A_MONTH
+            position += 1
+            if position < end and input_string[position] in "oO":
+                position = __match_word(input_string, position, end, __ONTH)
+                if position > units_start + 1 and position < end:
+                    if input_string[position] in __S:
+                        position += 1
+        elif char in "yY":
+            position += 1
+            if position < end and input_string[position] in "eE":
+                position = __match_word(input_string, position, end, __EA)
+            if position < end and input_string[position] in "rR":
+                position += 1
+                if position < end and input_string[position] in __S:
+                    position += 1
+        elif char in "wW":
+            unit = WEEK
+            multiplier = DAYS_IN_A_WEEK
+            position += 1
+            if position < end and input_string[position] in "eE":
+                position = __match_word(input_string, position, end, __EE)
+            if position < end and input_string[position] in __K:
+                position += 1
+                if position < end and input_string[position] in __S:
+                    position += 1
+    units_end = position
+    if position < end and input_string[position] == "*":
+        position += 1
+    if position != end:
+        raise __invalid_input(input_string, start, end)
+
+    units = input_string[units_start:units_end] if units_end > units_start else None
+    scale = 10**decimals
+    # whole numbers of years, months & weeks are periods, whose timedeltas are
+    # cached
+    count, remainder = divmod(number * 12 if unit == YEAR else number, scale)
+    if not remainder:
+        return period_timedelta(count, MONTH if unit == YEAR else unit), units
+    # true division of integers is correctly rounded, like float()
+    return timedelta(days=number / scale * multiplier), units
+
+
+__cached_parse_tenor = lru_cache(maxsize=TENOR_CACHE_SIZE)(__parse_tenor)
+
+
+def set_tenor_cache_size(maxsize):
+    """
+    Replaces the cache of `string_to_timedelta` with an empty one holding up to
+    `maxsize` strings, None for no limit and 0 to disable caching.
+    """
+    global __cached_parse_tenor
+    __cached_parse_tenor = lru_cache(maxsize=maxsize)(__parse_tenor)
+
+
+def tenor_cache_info():
+    """
+    Returns the hits, misses, maxsize & current size of the cache of
+    `string_to_timedelta`.
+    """
+    return __cached_parse_tenor.cache_info()
+
+
+def clear_tenor_cache():
+    __cached_parse_tenor.cache_clear()
+
+
+ON_ERROR_RAISE = "raise"
+ON_ERROR_MASK = "mask"
+ON_ERROR_CHOICES = (ON_ERROR_RAISE, ON_ERROR_MASK)
+
+
+def parse_tenors(values, on_error=ON_ERROR_RAISE):
+    """
+    Parses an array like of tenors, e.g. a column of a curve file, into a numpy
+    array of timedelta64[us] of the same shape. Each distinct value is parsed
+    once, strings & timedeltas with `string_to_timedelta`, tenors, periods &
+    timedelta64 as their timedelta. None, NaN & NaT are parsed as NaT and ranges
+    are invalid (see `parse_tenor_ranges`).
+    `on_error` decides what happens to invalid values:
+    - "raise": a single ValueError with all the invalid values is raised.
+    - "mask": a masked array is returned, the invalid values are masked.
+    Requires numpy.
+    """
+    durations, _ = __parse_tenor_array(values, on_error, ranges=False)
+    return durations
+
+
+def parse_tenor_ranges(values, on_error=ON_ERROR_RAISE):
+    """
+    Same as `parse_tenors` for ranges like "1-3Y", returns a pair of arrays of
+    the starts & the ends of the ranges. Tenors that aren't ranges are invalid.
+    """
+    return __parse_tenor_array(values, on_error, ranges=True)
+
+
+def __is_missing(value):
+    """
+    None, NaN & NaT, of numpy or pandas too.
+    """
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except (TypeError, ValueError):
+        # e.g. the arrays of ragged cells
+        return False
+
+
+def __parse_tenor_array(values, on_error, ranges):
+    import numpy
+
+    from origin_common.constants.base import Constant
+
+    if on_error not in ON_ERROR_CHOICES:
+        raise ValueError(
+            f"'on_error' must be one of {join_list(ON_ERROR_CHOICES)}, "
+            f"not '{on_error}'."
+        )
+    values = numpy.asarray(values, dtype=object)
+    flat = values.ravel()
+    # the position of every value in the distinct values
+    uniques = {}
+    distinct = []
+    codes = numpy.empty(flat.size, dtype=numpy.intp)
+    for position, value in enumerate(flat):
+        try:
+            code = uniques.setdefault(value, len(distinct))
+        except TypeError:
+            # unhashable cells, like the lists of ragged arrays, are all distinct
+            code = len(distinct)
+        if code == len(distinct):
+            distinct.append(value)
+        codes[position] = code
+    starts = numpy.full(len(distinct), numpy.timedelta64("NaT"), dtype="m8[us]")
+    ends = starts.copy()
+    invalid = numpy.zeros(len(distinct), dtype=bool)
+    for code, value in enumerate(distinct):
+        if isinstance(value, Constant):
+            # tenors are parsed as their timedelta
+            value = value.value
+        if isinstance(value, Period):
+            value = period_timedelta(value.count, value.unit)
+        if __is_missing(value):
+            continue
+        try:
+            if isinstance(value, numpy.timedelta64):
+                duration = value
+            elif isinstance(value, (str, timedelta)):
+                duration = string_to_timedelta(value)
+            else:
+                raise ValueError
+        except ValueError:
+            invalid[code] = True
+            continue
+        is_range = isinstance(duration, tuple)
+        if is_range != ranges:
+            invalid[code] = True
+        elif ranges:
+            starts[code], ends[code] = duration
+        else:
+            starts[code] = duration
+
+    if on_error == ON_ERROR_RAISE and invalid.any():
+        invalid_values = [
+            repr(value) for code, value in enumerate(distinct) if invalid[code]
+        ]
+        raise ValueError(f"Invalid tenors {join_list(invalid_values)}.")
+    starts = starts[codes].reshape(values.shape)
+    ends = ends[codes].reshape(values.shape)
+    if on_error == ON_ERROR_MASK:
+        mask = invalid[codes].reshape(values.shape)
+        starts = numpy.ma.MaskedArray(starts, mask=mask)
+        ends = numpy.ma.MaskedArray(ends, mask=mask.copy())
+    return starts, ends
 
 
 def timedelta_to_string(
@@ -122,6 +468,8 @@ def timedelta_to_string(
         return None
     if not duration:
         return "0"  # no units for 0
+    if isinstance(duration, Period):
+        duration = period_timedelta(duration.count, duration.unit)
     if duration == timedelta(days=1):
         if for_quantlib:
             return "1D"
@@ -129,15 +477,282 @@ def timedelta_to_string(
             return "O/N"
         return "Overnight"
 
-    units, value = __get_duration_units(duration, round_ndigits, only_quarter_years)
-    if for_quantlib and isinstance(value, float):
-        int_part, decimal_part = str(value).split(".")
-        return "{}{}".format(
-            timedelta_to_string(string_to_timedelta(f"{int_part}{units}")),
-            timedelta_to_string(string_to_timedelta(f"0.{decimal_part}{units}")),
+    units, value = __get_duration_units(duration, only_quarter_years)
+    return __format_duration_units(
+        units, value, only_initial, round_ndigits, for_quantlib
+    )
+
+
+# timedelta64 microseconds up to 2 ** 53 are exact as floats, so their days are
+# computed like `timedelta.total_seconds` does
+MAX_EXACT_MICROSECONDS = 2**53
+MAX_EXACT_DURATION = timedelta(microseconds=MAX_EXACT_MICROSECONDS)
+QUARTER_MICROSECONDS = timedelta(days=3 * DAYS_IN_A_MONTH) // timedelta(microseconds=1)
+UNITS = ("W", "M", "Y")
+
+
+def format_tenors(
+    durations,
+    only_initial=True,
+    round_ndigits=None,
+    only_quarter_years=True,
+    for_quantlib=False,
+):
+    """
+    Same as `timedelta_to_string` for an array like of timedeltas or a
+    timedelta64 array, returns an object array of the strings with the same
+    shape. The units & values are computed with numpy for the whole array and
+    each distinct value is formatted once. None & NaT are returned as None,
+    strings unchanged. Requires numpy.
+    """
+    import numpy
+
+    assert (
+        not for_quantlib or for_quantlib is only_initial
+    ), "QuantLib requires only initials"
+    durations = numpy.asarray(durations)
+    shape = durations.shape
+    results = numpy.full(durations.size, None, dtype=object)
+    if durations.dtype.kind == "m":
+        microseconds = durations.astype("m8[us]").ravel().view(numpy.int64)
+        positions = numpy.flatnonzero(~numpy.isnat(durations.ravel()))
+    else:
+        from origin_common.constants.base import Constant
+
+        durations = durations.astype(object).ravel()
+        for position, duration in enumerate(durations):
+            if isinstance(duration, Constant):
+                # tenors are formatted like their timedelta
+                duration = durations[position] = duration.value
+            if isinstance(duration, str):
+                results[position] = duration
+            elif isinstance(duration, timedelta) and (
+                abs(duration) > MAX_EXACT_DURATION
+            ):
+                # may not even fit in a timedelta64
+                results[position] = timedelta_to_string(
+                    duration,
+                    only_initial,
+                    round_ndigits,
+                    only_quarter_years,
+                    for_quantlib,
+                )
+            else:
+                continue
+            durations[position] = None
+        durations = durations.astype("m8[us]")
+        microseconds = durations.view(numpy.int64)
+        positions = numpy.flatnonzero(~numpy.isnat(durations))
+    microseconds = microseconds[positions]
+
+    zero = microseconds == 0
+    results[positions[zero]] = "0"
+    one_day = microseconds == DAY_MICROSECONDS
+    results[positions[one_day]] = timedelta_to_string(
+        timedelta(days=1), only_initial, round_ndigits, only_quarter_years, for_quantlib
+    )
+    inexact = numpy.abs(microseconds) > MAX_EXACT_MICROSECONDS
+    for position, value in zip(positions[inexact], microseconds[inexact]):
+        results[position] = timedelta_to_string(
+            timedelta(microseconds=int(value)),
+            only_initial,
+            round_ndigits,
+            only_quarter_years,
+            for_quantlib,
         )
-    if only_initial:
-        return f"{value}{units}"
-    if value > 1:
-        return f"{value} {expand_duration_unit(units)}s"
-    return f"{value} {expand_duration_unit(units)}"
+    rest = ~(zero | one_day | inexact)
+    positions, microseconds = positions[rest], microseconds[rest]
+
+    total_days = microseconds / 10**6 / SECONDS_IN_A_DAY
+    weeks = total_days < DAYS_IN_A_MONTH
+    months = ~weeks & (total_days < DAYS_IN_A_YEAR)
+    if only_quarter_years:
+        months |= ~weeks & (microseconds % QUARTER_MICROSECONDS != 0)
+    years = ~(weeks | months)
+    values = numpy.empty(len(total_days))
+    values[weeks] = total_days[weeks] // DAYS_IN_A_WEEK
+    values[months] = total_days[months] / DAYS_IN_A_MONTH
+    values[years] = total_days[years] / DAYS_IN_A_YEAR
+    for units, selected in zip(UNITS, (weeks, months, years)):
+        unique_values, inverse = numpy.unique(values[selected], return_inverse=True)
+        strings = numpy.array(
+            [
+                __format_duration_units(
+                    units, value, only_initial, round_ndigits, for_quantlib
+                )
+                for value in unique_values.tolist()
+            ],
+            dtype=object,
+        )
+        results[positions[selected]] = strings[inverse]
+    return results.reshape(shape)
+
+
+class TenorRangeIndex:
+    """
+    Indexes tenor ranges like "1-3Y", "6M-2Y" or (start, end) timedelta tuples,
+    to find the ranges overlapping or containing tenors without scanning all of
+    them. Ranges include their start & end.
+    Tenors can be strings, timedeltas, Tenor constants, Periods or ranges, the
+    queries return the ascending positions of the matching ranges in `ranges`.
+    Requires numpy.
+    """
+
+    def __init__(self, ranges):
+        import numpy
+
+        self.ranges = list(ranges)
+        bounds = []
+        invalid = []
+        for value in self.ranges:
+            try:
+                parsed = string_to_timedelta(value) if isinstance(value, str) else value
+                if not isinstance(parsed, tuple):
+                    raise ValueError
+                bounds.append(self.__interval(parsed))
+            except (ValueError, TypeError):
+                invalid.append(repr(value))
+        if invalid:
+            raise ValueError(f"Invalid tenor ranges {join_list(invalid)}.")
+
+        bounds = numpy.array(bounds, dtype=numpy.int64).reshape(-1, 2)
+        self.__starts = bounds[:, 0].copy()
+        self.__ends = bounds[:, 1].copy()
+        # the ranges by start, for the ranges starting within a queried range
+        self.__start_order = numpy.argsort(self.__starts, kind="stable")
+        self.__sorted_starts = self.__starts[self.__start_order]
+        # the ranges containing a point only change at these, so the points
+        # between two of them or on one of them share their ranges. The last
+        # one is past any timedelta.
+        self.__endpoints = numpy.append(
+            numpy.unique(bounds), numpy.iinfo(numpy.int64).max
+        )
+
+    def __len__(self):
+        return len(self.ranges)
+
+    @property
+    def starts(self):
+        return self.__starts.view("m8[us]")
+
+    @property
+    def ends(self):
+        return self.__ends.view("m8[us]")
+
+    def overlapping(self, tenor):
+        """
+        Returns the positions of the ranges sharing at least a point with the
+        tenor or range.
+        """
+        start, end = self.__interval(tenor)
+        return self.__match(self.__stab(start), start, end, containing=False)
+
+    def containing(self, tenor):
+        """
+        Returns the positions of the ranges that the whole tenor or range is in.
+        """
+        start, end = self.__interval(tenor)
+        return self.__match(self.__stab(start), start, end, containing=True)
+
+    def overlapping_many(self, tenors):
+        """
+        Same as `overlapping` for each of many tenors, e.g. the tenors of a
+        stream of quotes or a timedelta64 array, returns a list of the positions
+        of the ranges. Equal tenors share the same read only array.
+        """
+        return self.__match_many(tenors, containing=False)
+
+    def containing_many(self, tenors):
+        """
+        Same as `containing` for each of many tenors, see `overlapping_many`.
+        """
+        return self.__match_many(tenors, containing=True)
+
+    @staticmethod
+    def __microseconds(tenor):
+        if isinstance(tenor, Period):
+            tenor = tenor.to_timedelta()
+        elif isinstance(tenor, str):
+            tenor = string_to_timedelta(tenor)
+        return tenor // ONE_MICROSECOND
+
+    @classmethod
+    def __interval(cls, tenor):
+        """
+        Returns the start & end microseconds of a range, or of a tenor twice.
+        """
+        if isinstance(tenor, str):
+            tenor = string_to_timedelta(tenor)
+        if isinstance(tenor, tuple):
+            start, end = tenor
+            start, end = cls.__microseconds(start), cls.__microseconds(end)
+            if end < start:
+                raise ValueError(f"Invalid range {tenor!r}, it ends before it starts.")
+            return start, end
+        microseconds = cls.__microseconds(tenor)
+        return microseconds, microseconds
+
+    def __stab(self, point):
+        """
+        Returns the positions of the ranges containing the point.
+        """
+        import numpy
+
+        matches = numpy.flatnonzero((self.__starts <= point) & (self.__ends >= point))
+        matches.flags.writeable = False
+        return matches
+
+    def __match(self, stabbed, start, end, containing):
+        """
+        Returns the ranges matching the start & end of a query from `stabbed`,
+        the ranges containing its start.
+        """
+        import numpy
+
+        if start == end:
+            return stabbed
+        if containing:
+            matches = stabbed[self.__ends[stabbed] >= end]
+        else:
+            # the ranges containing the start, or starting within the query
+            first, last = numpy.searchsorted(
+                self.__sorted_starts, (start, end), side="right"
+            )
+            matches = numpy.sort(
+                numpy.concatenate((stabbed, self.__start_order[first:last]))
+            )
+        matches.flags.writeable = False
+        return matches
+
+    def __match_many(self, tenors, containing):
+        import numpy
+
+        if isinstance(tenors, numpy.ndarray) and tenors.dtype.kind == "m":
+            starts = tenors.ravel().astype("m8[us]").view(numpy.int64)
+            ends = starts
+        else:
+            # each distinct tenor is converted once
+            uniques = {}
+            codes = [uniques.setdefault(tenor, len(uniques)) for tenor in tenors]
+            bounds = numpy.array(
+                [self.__interval(tenor) for tenor in uniques], dtype=numpy.int64
+            ).reshape(-1, 2)[codes]
+            starts, ends = bounds[:, 0], bounds[:, 1]
+        # the slot of the points on the endpoints are odd, between them even
+        positions = numpy.searchsorted(self.__endpoints, starts)
+        slots = positions * 2 + (self.__endpoints[positions] == starts)
+
+        stabbed = {}
+        matched = {}
+        results = []
+        for start, end, slot in zip(starts.tolist(), ends.tolist(), slots.tolist()):
+            matches = matched.get((start, end))
+            if matches is None:
+                ranges = stabbed.get(slot)
+                if ranges is None:
+                    ranges = stabbed[slot] = self.__stab(start)
+                matches = matched[start, end] = self.__match(
+                    ranges, start, end, containing
+                )
+            results.append(matches)
+        return results
@@ -13,5 +13,7 @@ setup(
     extras_require={
         "django": ["Django"],
         "djangorest": ["Django", "djangorestframework"],
+        "msgpack": ["msgpack"],
+        "numpy": ["numpy"],
     },
 )
@@ -1,17 +1,51 @@
+import copy
 import json
 import operator
+import pickle
 from datetime import date
+from itertools import cycle, islice
+from threading import Thread
 from unittest import TestCase
 
+import numpy
+
 from origin_common.better_test_mixins import LruCacheTestMixin
+from origin_common.constants import base
 from origin_common.constants.base import (
     Constant,
     Constants,
     DuplicateConstantError,
+    LookupStats,
+    add_operator_methods,
+    add_sorting_functions,
+    normalize_lookup_key,
     perform_on_constant,
 )
 
 
+class PickledConstants(Constants):
+    ONE = Constant(1, "One")
+    TWO = Constant(2, "Two")
+
+
+PICKLED_CONSTANTS = PickledConstants()
+
+
+class MutatedConstants(Constants):
+    ONE = Constant(1, "One")
+
+
+MUTATED_CONSTANTS = MutatedConstants()
+
+
+class CountedConstants(Constants):
+    ONE = Constant(1, "One")
+    TWO = Constant(2, "Two")
+
+
+COUNTED_CONSTANTS = CountedConstants()
+
+
 class TestConstant(TestCase):
     def test_str(self):
         const = Constant(value=123, label="Foo")
@@ -26,11 +60,73 @@ class TestConstant(TestCase):
         const = Constant(value=123, label="Foo")
         assert repr(const) == f"<Constant: {const} at {hex(id(const))}>"
 
+    def test_str_is_cached(self):
+        const = Constant(value=123, label="Foo")
+        assert str(const) is str(const)
+        assert repr(const) is repr(const)
+
+    def test_str_is_recomputed_after_a_change(self):
+        class DummyConstant(Constant):
+            __slots__ = ("other",)
+
+        other = Constant(value=1, label="One")
+        const = DummyConstant(value=123, label="Foo")
+        const.other = other
+        assert str(const) == "value=123, label=Foo, other=1"
+        const.label = "Bar"
+        assert str(const) == "value=123, label=Bar, other=1"
+        # changes of the constants it shows are picked up too
+        other.value = 2
+        assert str(const) == "value=123, label=Bar, other=2"
+        const.value = 321
+        assert repr(const) == f"<DummyConstant: 321 at {hex(id(const))}>"
+
+    def test_short_repr(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        assert dummy.c1.short_repr() == "<Constant: Dummy.c1>"
+        assert Constant(2, "two").short_repr() == "<Constant: two>"
+
+    def test_use_short_repr(self):
+        class DummyConstant(Constant):
+            __slots__ = ()
+            use_short_repr = True
+
+        assert repr(DummyConstant(1, "one")) == "<DummyConstant: one>"
+        assert repr(Constant(1, "one")).startswith("<Constant: 1 at ")
+
     def test_equality(self):
         const = Constant(value=123, label="Foo")
         assert const == const
         assert const == 123
 
+    def test_not_equal_to_objects_with_the_same_hash(self):
+        class SameHash:
+            def __hash__(self):
+                return hash(123)
+
+        const = Constant(value=123, label="Foo")
+        assert const != SameHash()
+
+    def test_equal_to_constants_with_the_same_value(self):
+        assert Constant(value=123, label="Foo") == Constant(value=123, label="Bar")
+        assert Constant(value=123, label="Foo") != Constant(value=321, label="Foo")
+
+    def test_hash_follows_the_value(self):
+        const = Constant(value=123, label="Foo")
+        assert hash(const) == hash(123)
+        const.value = 321
+        assert hash(const) == hash(321)
+        assert const in {321}
+
+    def test_unhashable_value(self):
+        const = Constant(value=[1], label="Foo")
+        assert const == [1]
+        with self.assertRaises(TypeError):
+            hash(const)
+
     def test_not_equal_to_non_hashable_types(self):
         const = Constant(value=123, label="Foo")
         # comparing does not throw an error
@@ -51,9 +147,31 @@ class TestConstant(TestCase):
         try:
             const.value = 321
             const.label = "Bar"
-            const.new_attribute = "Baz"
         except AttributeError:
             self.fail("AttributeError raised while mutable.")
+        # only the attributes declared in `__slots__` can be set
+        with self.assertRaises(AttributeError):
+            const.new_attribute = "Baz"
+
+    def test_does_not_have_a_dict(self):
+        const = Constant(value=123, label="Foo")
+        assert not hasattr(const, "__dict__")
+
+    def test_str_of_subclasses(self):
+        class Slotted(Constant):
+            __slots__ = ("extra",)
+
+            def __init__(self, value, label, extra):
+                super().__init__(value, label)
+                self.extra = extra
+
+        class NotSlotted(Constant):
+            def __init__(self, value, label, extra):
+                super().__init__(value, label)
+                self.extra = extra
+
+        assert str(Slotted(1, "one", "foo")) == "value=1, label=one, extra=foo"
+        assert str(NotSlotted(1, "one", "foo")) == "value=1, label=one, extra=foo"
 
     def test_json_dumps(self):
         const = Constant(value=123, label="Foo")
@@ -137,6 +255,59 @@ class TestConstants(LruCacheTestMixin, TestCase):
         with self.assertRaises(KeyError):
             assert dummy[c2]
 
+    def test_get(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        assert dummy.get(1) is dummy.c1
+        assert dummy.get(dummy.c1) is dummy.c1
+        assert dummy.get(2) is None
+        assert dummy.get(2, "default") == "default"
+
+    def test_get_by_label_with_default(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        assert dummy.get_by_label("one", None) is dummy.c1
+        assert dummy.get_by_label("two", None) is None
+        with self.assertRaises(KeyError):
+            dummy.get_by_label("two")
+
+    def test_get_many(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+            c2 = Constant(2, "two")
+
+        dummy = Dummy()
+        assert dummy.get_many([2, dummy.c1]) == ([dummy.c2, dummy.c1], [])
+        assert dummy.get_many(iter([3, 1, 4]), on_missing="none") == (
+            [None, dummy.c1, None],
+            [3, 4],
+        )
+        assert dummy.get_many([3, 1, 4], on_missing="skip") == ([dummy.c1], [3, 4])
+        with self.assertRaises(KeyError) as context:
+            dummy.get_many([3, 1, 4])
+        assert context.exception.args == ([3, 4],)
+        with self.assertRaises(ValueError):
+            dummy.get_many([1], on_missing="ignore")
+
+    def test_get_many_by_label(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+            c2 = Constant(2, "two")
+
+        dummy = Dummy()
+        assert dummy.get_many_by_label(["two", "one"]) == ([dummy.c2, dummy.c1], [])
+        assert dummy.get_many_by_label(["three", "one"], on_missing="none") == (
+            [None, dummy.c1],
+            ["three"],
+        )
+        assert dummy.get_many_by_label(["three"], on_missing="skip") == ([], ["three"])
+        with self.assertRaises(KeyError):
+            dummy.get_many_by_label(["three"])
+
     def test_get_label_from_value(self):
         class Dummy(Constants):
             c1 = Constant(1, "one")
@@ -201,13 +372,93 @@ class TestConstants(LruCacheTestMixin, TestCase):
         assert json.dumps(dummy) == json.dumps([c.value for c in dummy])
         self.assert_has_lru_cache(dummy.to_json)
 
-    def test_cannot_have_duplicate_values(self):
+    def test_cached_results_are_recomputed_after_a_change(self):
         class Dummy(Constants):
             c1 = Constant(1, "one")
-            c2 = Constant(1, "two")
 
+        dummy = Dummy()
+        dummy.make_immutable()
+        assert dummy.to_django_choices() == ((1, "one"),)
+        assert dummy.to_django_choices() is dummy.to_django_choices()
+        generation = dummy.generation
+
+        dummy.make_mutable()
+        dummy.c1.label = "uno"
+        dummy.c2 = Constant(2, "two")
+        dummy.make_immutable()
+        assert dummy.generation > generation
+        assert dummy.to_django_choices() == ((1, "uno"), (2, "two"))
+        assert json.dumps(dummy) == "[1, 2]"
+
+    def test_reads_while_mutable_see_the_changes(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+            c2 = Constant(2, "two")
+
+        dummy = Dummy()
+        assert dummy.to_django_choices() == ((1, "one"), (2, "two"))
+        assert dummy.get(1) is dummy.c1
+        generation = dummy.generation
+
+        dummy.make_mutable()
+        dummy.c1.label = "uno"
+        assert dummy.to_django_choices() == ((1, "uno"), (2, "two"))
+        dummy.c1.value = 3
+        assert dummy.generation > generation
+        assert dummy.get(1) is None
+        assert dummy.get(3) is dummy.c1
+        assert dummy.to_json() == [3, 2]
+        assert dummy.get_by_label("uno") is dummy.c1
+
+    def test_changes_to_shared_constants_invalidate_all_their_constants(self):
+        shared = Constant(1, "one")
+
+        class First(Constants):
+            c1 = shared
+
+        class Second(Constants):
+            c0 = Constant(0, "zero")
+            c1 = shared
+
+        first, second = First(), Second()
+        assert second.get(1) is shared
+        assert second.to_django_choices() == ((0, "zero"), (1, "one"))
+
+        first.make_mutable()
+        shared.value = 3
+        first.make_immutable()
+        assert second.get(1) is None
+        assert second.get(3) is shared
+        assert second.to_django_choices() == ((0, "zero"), (3, "one"))
+
+    def test_cached_method_cache_info_and_clear(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        dummy.to_json()
+        dummy.to_django_choices()
+        assert dummy.to_json.cache_info() == (dummy.generation, 1)
+        dummy.to_json.cache_clear()
+        assert dummy.to_json.cache_info().currsize == 0
+        assert dummy.to_django_choices.cache_info().currsize == 1
+
+    def test_cached_results_are_per_instance(self):
+        class Dummy1(Constants):
+            c1 = Constant(1, "one")
+
+        class Dummy2(Dummy1):
+            c2 = Constant(2, "two")
+
+        assert Dummy1().to_json() == [1]
+        assert Dummy2().to_json() == [1, 2]
+
+    def test_cannot_have_duplicate_values(self):
         with self.assertRaises(DuplicateConstantError):
-            Dummy()
+
+            class Duplicated(Constants):
+                c1 = Constant(1, "one")
+                c2 = Constant(1, "two")
 
         class Dummy(Constants):
             c1 = Constant(1, "one")
@@ -216,6 +467,474 @@ class TestConstants(LruCacheTestMixin, TestCase):
         with self.assertRaises(DuplicateConstantError):
             d.c3 = Constant(1, "one")
 
+    def test_constants_are_in_definition_order(self):
+        c1 = Constant(1, "one")
+
+        class Dummy(Constants):
+            c2 = Constant(2, "two")
+            c1_alias = c1
+
+        assert list(Dummy()) == [Dummy.c2, c1]
+
+    def test_constants_are_inherited(self):
+        class Parent(Constants):
+            c1 = Constant(1, "one")
+            c2 = Constant(2, "two")
+
+        class Child(Parent):
+            c3 = Constant(3, "three")
+            c1 = Constant(4, "four")
+            c2 = None
+
+        assert list(Child()) == [Child.c1, Child.c3]
+        assert list(Parent()) == [Parent.c1, Parent.c2]
+        assert Child() is not Parent()
+
+    def test_duplicates_with_inherited_constants_are_detected(self):
+        class Parent(Constants):
+            c1 = Constant(1, "one")
+
+        with self.assertRaises(DuplicateConstantError):
+
+            class Child(Parent):
+                c2 = Constant(1, "two")
+
+    def test_adding_a_constant_to_the_instance_does_not_change_the_class(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        dummy.c2 = Constant(2, "two")
+        assert list(dummy) == [Dummy.c1, dummy.c2]
+        assert 2 in dummy
+        assert list(Dummy._ordered_fields.values()) == [Dummy.c1]
+
+    def test_constants_have_ordinals(self):
+        class Dummy(Constants):
+            c1 = Constant("b", "one")
+            c2 = Constant("a", "two")
+
+        assert Dummy.c1.ordinal == 0
+        assert Dummy.c2.ordinal == 1
+        assert Constant(1, "one").ordinal is None
+
+    def test_lookup(self):
+        class Dummy(Constants):
+            c1 = Constant("EUR", "Euro")
+            c2 = Constant(2, "1.5 Years")
+
+        dummy = Dummy()
+        for key in ("eur", " Eur ", "EUR", "e-u_r", dummy.c1, "euro", "EURO."):
+            assert dummy.lookup(key) is dummy.c1, key
+        assert dummy.lookup(2) is dummy.c2
+        assert dummy.lookup("1.5years") is dummy.c2
+        with self.assertRaises(KeyError):
+            dummy.lookup("15 years")
+        with self.assertRaises(KeyError):
+            dummy.lookup("2")
+        assert dummy.lookup("usd", None) is None
+
+    def test_lookup_aliases(self):
+        class DummyConstant(Constant):
+            __slots__ = ("alias",)
+
+            def __init__(self, value, label, alias=None):
+                super().__init__(value, label)
+                self.alias = alias
+
+        class Dummy(Constants):
+            lookup_aliases = ("alias",)
+            c1 = DummyConstant("a", "One", alias="first")
+            c2 = DummyConstant("b", "Two", alias="shared")
+            c3 = DummyConstant("c", "Three", alias="shared")
+            c4 = DummyConstant("d", "Four", alias="one")
+            c5 = DummyConstant("e", "Five")
+
+        dummy = Dummy()
+        assert dummy.lookup("First") is dummy.c1
+        # values & labels take precedence over the aliases
+        assert dummy.lookup("one") is dummy.c1
+        # ambiguous aliases don't match
+        assert dummy.lookup("shared", None) is None
+
+    def test_lookup_index_is_reset_when_a_constant_is_added(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        assert dummy.lookup("two", None) is None
+        with dummy.mutate() as draft:
+            draft.c2 = Constant(2, "two")
+        assert dummy.lookup("TWO") is dummy.c2
+
+    def test_sort_key(self):
+        class Dummy(Constants):
+            c1 = Constant("b", "one")
+            c2 = Constant("a", "two")
+
+        dummy = Dummy()
+        assert dummy.sort_key(dummy.c2) == 1
+        assert dummy.sort_key("b") == 0
+        assert sorted(["a", dummy.c1], key=dummy.sort_key) == [dummy.c1, "a"]
+        with self.assertRaises(KeyError):
+            dummy.sort_key("c")
+
+    def test_sort(self):
+        class Dummy(Constants):
+            c1 = Constant("b", "one")
+            c2 = Constant("a", "two")
+            c3 = Constant("c", "three")
+
+        dummy = Dummy()
+        assert dummy.sort(["c", "a", "b"]) == ["b", "a", "c"]
+        assert dummy.sort([dummy.c3, "a", dummy.c1]) == [dummy.c1, "a", dummy.c3]
+        assert dummy.sort(["a", "b"], reverse=True) == ["a", "b"]
+        with self.assertRaises(KeyError):
+            dummy.sort(["a", "d"])
+
+    def test_constant_added_to_the_instance_gets_an_ordinal(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        dummy.c2 = Constant(2, "two")
+        assert dummy.c2.ordinal == 1
+        assert dummy.sort([2, 1]) == [1, 2]
+
+    def test_filter(self):
+        class Related(Constant):
+            __slots__ = ("flag",)
+
+            def __init__(self, value, label, flag):
+                super().__init__(value, label)
+                self.flag = flag
+
+        class Extra(Constant):
+            __slots__ = ("related", "even")
+
+            def __init__(self, value, label, related, even):
+                super().__init__(value, label)
+                self.related = related
+                self.even = even
+
+        r1 = Related("r1", "R1", flag=True)
+        r2 = Related("r2", "R2", flag=False)
+
+        class Dummy(Constants):
+            c1 = Extra(1, "one", related=r1, even=False)
+            c2 = Extra(2, "two", related=r2, even=True)
+            c3 = Extra(3, "three", related=r1, even=False)
+            c4 = Extra(4, "four", related=None, even=True)
+            c5 = Constant(5, "five")
+
+        dummy = Dummy()
+        assert dummy.filter() == tuple(dummy)
+        assert dummy.filter(even=False) == (dummy.c1, dummy.c3)
+        assert dummy.filter(related=r1) == (dummy.c1, dummy.c3)
+        assert dummy.filter(related="r2") == (dummy.c2,)
+        assert dummy.filter(related=None) == (dummy.c4,)
+        assert dummy.filter(related__flag=True) == (dummy.c1, dummy.c3)
+        assert dummy.filter(related__flag=True, even=True) == ()
+        assert dummy.filter(related__flag=False, even=True) == (dummy.c2,)
+        assert dummy.filter(label="five") == (dummy.c5,)
+        assert dummy.filter(missing=1) == ()
+
+    def test_filter_on_unhashable_attribute(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        dummy.make_mutable()
+        dummy.c1.label = ["one"]
+        with self.assertRaises(TypeError):
+            dummy.filter(label=["one"])
+
+    def test_group_by(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "odd")
+            c2 = Constant(2, "even")
+            c3 = Constant(3, "odd")
+
+        dummy = Dummy()
+        assert dummy.group_by("label") == {
+            "odd": (dummy.c1, dummy.c3),
+            "even": (dummy.c2,),
+        }
+
+    def test_indexes_are_reset_when_a_constant_is_added(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        assert dummy.filter(label="two") == ()
+        dummy.c2 = Constant(2, "two")
+        assert dummy.filter(label="two") == (dummy.c2,)
+
+    def test_mutate(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+            c2 = Constant(2, "two")
+
+        dummy = Dummy()
+        dummy.make_immutable()
+        generation = dummy.generation
+        c1 = dummy.c1
+        with dummy.mutate() as draft:
+            assert draft.c1 is c1
+            draft.c1 = Constant(1, "replaced")
+            draft.c3 = Constant(3, "three")
+            # not published until the block exits
+            assert dummy.c1 is c1
+            assert 3 not in dummy
+        assert dummy.c1.label == "replaced"
+        assert dummy.get(1) is dummy.c1
+        assert dummy.get_by_label("three") is dummy.c3
+        assert list(dummy) == [dummy.c1, dummy.c2, dummy.c3]
+        assert dummy.c3.ordinal == 2
+        assert dummy.generation == generation + 1
+        # the constants stay immutable
+        with self.assertRaises(AttributeError):
+            dummy.c4 = Constant(4, "four")
+
+    def test_mutate_is_not_published_on_error(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        with self.assertRaises(ValueError):
+            with dummy.mutate() as draft:
+                draft.c2 = Constant(2, "two")
+                raise ValueError
+        with self.assertRaises(DuplicateConstantError):
+            with dummy.mutate() as draft:
+                draft.c2 = Constant(2, "two")
+                draft.c3 = Constant(1, "duplicate")
+        assert list(dummy) == [dummy.c1]
+        assert not hasattr(dummy, "c2")
+
+    def test_draft_only_accepts_constants(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        with Dummy().mutate() as draft:
+            with self.assertRaises(AttributeError):
+                draft.c2 = 2
+            with self.assertRaises(AttributeError):
+                draft.missing
+
+    def test_lookups_during_mutations_see_whole_snapshots(self):
+        class Dummy(Constants):
+            c0 = Constant(0, "0")
+
+        dummy = Dummy()
+        errors = []
+
+        def read():
+            for _ in range(2000):
+                constants = list(dummy)
+                # the constants & the mappings always match
+                if len(dummy) < len(constants) or constants[-1] not in dummy:
+                    errors.append(constants)
+
+        readers = [Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(1, 200):
+            with dummy.mutate() as draft:
+                setattr(draft, f"c{i}", Constant(i, str(i)))
+        for reader in readers:
+            reader.join()
+        assert errors == []
+        assert len(dummy) == 200
+
+    def test_invalidations_during_mutations_keep_the_constants(self):
+        class Dummy(Constants):
+            c0 = Constant(0, "0")
+
+        dummy = Dummy()
+        done = []
+
+        def invalidate():
+            while not done:
+                dummy._invalidate()
+
+        invalidators = [Thread(target=invalidate) for _ in range(2)]
+        for invalidator in invalidators:
+            invalidator.start()
+        for i in range(1, 200):
+            with dummy.mutate() as draft:
+                setattr(draft, f"c{i}", Constant(i, str(i)))
+        done.append(True)
+        for invalidator in invalidators:
+            invalidator.join()
+        assert len(dummy) == 200
+        assert list(dummy)[-1] is dummy.c199
+
+    def test_generation_goes_up_when_initialised_again(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        with dummy.mutate() as draft:
+            draft.c2 = Constant(2, "two")
+        generation = dummy.generation
+        assert Dummy() is dummy
+        assert dummy.generation > generation
+        assert list(dummy) == [dummy.c1, dummy.c2]
+
+    def test_constants_generation_changes_with_any_constants(self):
+        class Dummy(Constants):
+            c1 = Constant(1, "one")
+
+        dummy = Dummy()
+        generations = [base.CONSTANTS_GENERATION]
+        with dummy.mutate() as draft:
+            draft.c2 = Constant(2, "two")
+        generations.append(base.CONSTANTS_GENERATION)
+        dummy.make_mutable()
+        generations.append(base.CONSTANTS_GENERATION)
+        dummy.c1.label = "One"
+        generations.append(base.CONSTANTS_GENERATION)
+        dummy.make_immutable()
+        generations.append(base.CONSTANTS_GENERATION)
+        assert len(set(generations)) == len(generations)
+
+    def test_encode(self):
+        class Dummy(Constants):
+            c1 = Constant("b", "one")
+            c2 = Constant("a", "two")
+
+        dummy = Dummy()
+        codes = dummy.encode(["a", dummy.c1, None, dummy.c2])
+        assert codes.dtype == numpy.int8
+        assert codes.tolist() == [1, 0, -1, 1]
+        with self.assertRaises(KeyError):
+            dummy.encode(["c"])
+
+    def test_code_dtype_fits_the_constants(self):
+        class Dummy(Constants):
+            pass
+
+        dummy = Dummy()
+        dummy.make_mutable()
+        for i in range(200):
+            setattr(dummy, f"c{i}", Constant(i, str(i)))
+        assert dummy.code_dtype == numpy.int16
+        assert dummy.encode([199]).tolist() == [199]
+
+    def test_decode(self):
+        class Dummy(Constants):
+            c1 = Constant("b", "one")
+            c2 = Constant("a", "two")
+
+        dummy = Dummy()
+        decoded = dummy.decode(numpy.array([[1, -1], [0, 1]], dtype=numpy.int8))
+        assert decoded.shape == (2, 2)
+        assert decoded.tolist() == [[dummy.c2, None], [dummy.c1, dummy.c2]]
+        assert decoded[0, 0] is dummy.c2
+        assert dummy.decode(dummy.encode(["a", "b"])).tolist() == ["a", "b"]
+        with self.assertRaises(ValueError):
+            dummy.decode([2])
+        with self.assertRaises(ValueError):
+            dummy.decode([-2])
+        with self.assertRaises(TypeError):
+            dummy.decode([1.0])
+
+
+class TestAddSortingFunctions(TestCase):
+    def test_compares_by_ordinal(self):
+        class DummyConstant(Constant):
+            __slots__ = ()
+
+        class Dummy(Constants):
+            c1 = DummyConstant("b", "one")
+            c2 = DummyConstant("a", "two")
+
+        dummy = Dummy()
+        add_sorting_functions(DummyConstant, dummy)
+        assert dummy.c1 < dummy.c2
+        assert dummy.c1 <= "a"
+        assert "a" > dummy.c1
+        assert sorted([dummy.c2, dummy.c1]) == [dummy.c1, dummy.c2]
+        # unregistered constants are compared using their value
+        assert DummyConstant("a", "other") > dummy.c1
+        with self.assertRaises(TypeError):
+            assert dummy.c1 < "c"
+
+    def test_constants_added_to_other_constants_first(self):
+        class DummyConstant(Constant):
+            __slots__ = ()
+
+        first, second = DummyConstant("b", "one"), DummyConstant("a", "two")
+
+        class Other(Constants):
+            c2 = second
+
+        Other()
+
+        class Dummy(Constants):
+            c1 = first
+            c2 = second
+
+        dummy = Dummy()
+        add_sorting_functions(DummyConstant, dummy)
+        # both are first in the constants they were added to first
+        assert first._ordinal == second._ordinal == 0
+        assert dummy.c1 < dummy.c2
+        assert dummy.c2 > "b"
+        assert sorted([dummy.c2, dummy.c1]) == [dummy.c1, dummy.c2]
+
+    def test_constants_declared_in_another_order_first(self):
+        class DummyConstant(Constant):
+            __slots__ = ()
+
+        a, b = DummyConstant("a", "one"), DummyConstant("b", "two")
+
+        c = DummyConstant("c", "three")
+
+        class Other(Constants):
+            q = b
+            p = a
+            r = c
+
+        class Dummy(Constants):
+            p = a
+            q = b
+
+        dummy = Dummy()
+        add_sorting_functions(DummyConstant, dummy)
+        # ordinals of the constants that declared them first, never instantiated
+        assert (a.ordinal, b.ordinal) == (1, 0)
+        assert a < b <= "b"
+        assert sorted([b, a]) == dummy.sort([b, a]) == [a, b]
+        # not attached to any instance, nor in these constants
+        assert c._reference is None
+        with self.assertRaisesRegex(TypeError, "Cannot compare"):
+            assert a < c
+
+
+class TestAddOperatorMethods(TestCase):
+    def setUp(self):
+        class DummyConstant(Constant):
+            __slots__ = ()
+
+        add_operator_methods(DummyConstant, int)
+        self.c2 = DummyConstant(2, "two")
+        self.c3 = DummyConstant(3, "three")
+
+    def test_operates_on_the_values(self):
+        assert self.c2 + self.c3 == 5
+        assert self.c3 - 1 == 2
+        assert 10 - self.c3 == 7
+        assert 2.5 * self.c2 == 5.0
+        assert divmod(7, self.c3) == (2, 1)
+        assert self.c2 < self.c3
+        assert pow(self.c2, self.c3, 5) == 3
+
+    def test_other_types_of_constants(self):
+        with self.assertRaises(TypeError):
+            self.c2 + Constant(1, "one")
+
 
 class TestPerformOnConstant(TestCase):
     def test_if_both_operands_are_constants_it_uses_value_of_both(self):
@@ -262,3 +981,134 @@ class TestJsonDumps(TestCase):
 
         with self.assertRaises(TypeError):
             json.dumps(Foo())
+
+
+class TestPickling(TestCase):
+    def test_constant_is_pickled_by_reference(self):
+        data = pickle.dumps(PICKLED_CONSTANTS.ONE)
+        assert b"One" not in data
+        assert pickle.loads(data) is PICKLED_CONSTANTS.ONE
+
+    def test_constants_are_pickled_by_reference(self):
+        assert pickle.loads(pickle.dumps(PICKLED_CONSTANTS)) is PICKLED_CONSTANTS
+
+    def test_copy(self):
+        assert copy.copy(PICKLED_CONSTANTS.ONE) is PICKLED_CONSTANTS.ONE
+        assert copy.deepcopy(PICKLED_CONSTANTS.ONE) is PICKLED_CONSTANTS.ONE
+        assert copy.deepcopy([PICKLED_CONSTANTS])[0] is PICKLED_CONSTANTS
+
+    def test_unregistered_constant_is_pickled_by_value(self):
+        const = Constant(3, "Three")
+        unpickled = pickle.loads(pickle.dumps(const))
+        assert unpickled is not const
+        assert (unpickled.value, unpickled.label) == (3, "Three")
+
+    def test_constant_added_to_the_instance_is_pickled_by_reference(self):
+        MUTATED_CONSTANTS.make_mutable()
+        MUTATED_CONSTANTS.THREE = Constant(3, "Three")
+        MUTATED_CONSTANTS.make_immutable()
+        assert pickle.loads(pickle.dumps(MUTATED_CONSTANTS.THREE)) is (
+            MUTATED_CONSTANTS.THREE
+        )
+
+    def test_replaced_constant_is_pickled_by_value(self):
+        one = MUTATED_CONSTANTS.ONE
+        MUTATED_CONSTANTS.make_mutable()
+        try:
+            MUTATED_CONSTANTS.ONE = Constant(1, "Replaced")
+            unpickled = pickle.loads(pickle.dumps(one))
+            assert unpickled is not one
+            assert unpickled.label == "One"
+        finally:
+            MUTATED_CONSTANTS.ONE = one
+            MUTATED_CONSTANTS.make_immutable()
+
+    def test_million_constants(self):
+        constants = list(islice(cycle(PICKLED_CONSTANTS), 1000000))
+        data = pickle.dumps(constants, pickle.HIGHEST_PROTOCOL)
+        # the 2 constants are pickled once, then referenced from the memo
+        assert len(data) < 2.1 * len(constants)
+        assert all(a is b for a, b in zip(pickle.loads(data), constants))
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        self.lookups = []
+        COUNTED_CONSTANTS.enable_instrumentation(
+            lambda *args: self.lookups.append(args)
+        )
+        self.addCleanup(COUNTED_CONSTANTS.disable_instrumentation)
+
+    def test_stats(self):
+        assert COUNTED_CONSTANTS[1] is COUNTED_CONSTANTS.ONE
+        with self.assertRaises(KeyError):
+            COUNTED_CONSTANTS[3]
+        assert COUNTED_CONSTANTS.get(2) is COUNTED_CONSTANTS.TWO
+        assert COUNTED_CONSTANTS.get(3, "missing") == "missing"
+        assert COUNTED_CONSTANTS.get_by_label("Two") is COUNTED_CONSTANTS.TWO
+        assert COUNTED_CONSTANTS.get_by_label("Three", None) is None
+        with self.assertRaises(KeyError):
+            COUNTED_CONSTANTS.get_by_label("Three")
+        assert 1 in COUNTED_CONSTANTS
+        assert 3 not in COUNTED_CONSTANTS
+        assert COUNTED_CONSTANTS.stats() == {
+            "__getitem__": (2, 1),
+            "get": (2, 1),
+            "get_by_label": (3, 2),
+            "__contains__": (2, 1),
+        }
+        assert COUNTED_CONSTANTS.stats()["__getitem__"].miss_rate == 0.5
+
+    def test_callback(self):
+        COUNTED_CONSTANTS.get_value("One")
+        assert 3 not in COUNTED_CONSTANTS
+        assert self.lookups == [
+            (COUNTED_CONSTANTS, "get_by_label", "One", True),
+            (COUNTED_CONSTANTS, "__contains__", 3, False),
+        ]
+
+    def test_enabling_again_resets_the_stats(self):
+        COUNTED_CONSTANTS[1]
+        COUNTED_CONSTANTS.enable_instrumentation()
+        assert COUNTED_CONSTANTS.stats()["__getitem__"] == (0, 0)
+        COUNTED_CONSTANTS[1]
+        assert COUNTED_CONSTANTS.stats()["__getitem__"] == (1, 0)
+        assert self.lookups == [(COUNTED_CONSTANTS, "__getitem__", 1, True)]
+
+    def test_disable(self):
+        COUNTED_CONSTANTS[1]
+        COUNTED_CONSTANTS.disable_instrumentation()
+        assert type(COUNTED_CONSTANTS) is CountedConstants
+        COUNTED_CONSTANTS[1]
+        assert COUNTED_CONSTANTS.stats()["__getitem__"] == (1, 0)
+        assert len(self.lookups) == 1
+
+    def test_never_enabled(self):
+        assert PICKLED_CONSTANTS.stats() == {}
+
+    def test_instrumented_constants_look_the_same(self):
+        assert isinstance(COUNTED_CONSTANTS, CountedConstants)
+        assert type(COUNTED_CONSTANTS).__name__ == "CountedConstants"
+        assert CountedConstants() is COUNTED_CONSTANTS
+        assert pickle.loads(pickle.dumps(COUNTED_CONSTANTS)) is (COUNTED_CONSTANTS)
+        assert pickle.loads(pickle.dumps(COUNTED_CONSTANTS.ONE)) is (
+            COUNTED_CONSTANTS.ONE
+        )
+
+    def test_miss_rate_without_lookups(self):
+        assert LookupStats(0, 0).miss_rate == 0.0
+
+
+class TestNormalizeLookupKey(TestCase):
+    def test_strings(self):
+        assert normalize_lookup_key(" 6mUSD LIBOR ") == "6musdlibor"
+        assert normalize_lookup_key("6musd-libor") == "6musdlibor"
+        assert normalize_lookup_key("ACT/365 (Fixed)") == "act365fixed"
+        assert normalize_lookup_key("1.5Y") == "1.5y"
+        assert normalize_lookup_key("U.S. Dollar.") == "usdollar"
+        assert normalize_lookup_key("Straße") == "strasse"
+
+    def test_constants_and_other_objects(self):
+        assert normalize_lookup_key(Constant("EUR", "Euro")) == "eur"
+        assert normalize_lookup_key(3) == 3
+        assert normalize_lookup_key(None) is None
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+import origin_common.constants
+from origin_common.constants.tenors import TENORS
+
+
+class TestLazyConstants(TestCase):
+    def test_only_imports_the_module_of_the_accessed_constants(self):
+        statement = (
+            "import sys\n"
+            "from origin_common.constants import TENORS\n"
+            "print(' '.join(sorted(m for m in sys.modules if 'constants.' in m)))"
+        )
+        output = subprocess.check_output(
+            [sys.executable, "-c", statement], universal_newlines=True
+        )
+        assert output.split() == [
+            "origin_common.constants.base",
+            "origin_common.constants.tenors",
+        ]
+
+    def test_does_not_import_the_utils(self):
+        statement = (
+            "import sys\n"
+            "import origin_common.constants as constants\n"
+            "for name in constants.__all__:\n"
+            "    getattr(constants, name)\n"
+            "print('origin_common.utils' in sys.modules)"
+        )
+        output = subprocess.check_output(
+            [sys.executable, "-c", statement], universal_newlines=True
+        )
+        assert output.strip() == "False"
+
+    def test_constants_are_the_same_as_in_their_module(self):
+        assert origin_common.constants.TENORS is TENORS
+
+    def test_all_constants_can_be_imported(self):
+        for name in origin_common.constants.__all__:
+            assert name in dir(origin_common.constants)
+            assert getattr(origin_common.constants, name) is not None
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            origin_common.constants.FOO
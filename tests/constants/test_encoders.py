@@ -0,0 +1,204 @@
+import io
+import json
+from datetime import date
+from unittest import TestCase
+
+import msgpack
+
+from origin_common.constants import CD_FUNDING_BASES, CURRENCIES, FUNDING_BASES, TENORS
+from origin_common.constants.base import Constant, Constants
+from origin_common.constants.encoders import (
+    ConstantsJSONEncoder,
+    MsgpackCodec,
+    json_default,
+)
+
+
+def make_trades(count):
+    return [
+        {
+            "id": i,
+            "currency": CURRENCIES.EUR if i % 2 else CURRENCIES.USD,
+            "tenor": TENORS.THREE_MONTH,
+            "funding_basis": FUNDING_BASES.EUR_3M,
+        }
+        for i in range(count)
+    ]
+
+
+def make_dummy_constants(count):
+    attributes = {f"C{i}": Constant(i, f"Label {i}") for i in range(count)}
+    return type("DummyConstants", (Constants,), attributes)()
+
+
+class TestJsonDefault(TestCase):
+    def test_constant(self):
+        assert json_default(TENORS.THREE_MONTH) == "3M"
+        assert json_default(CURRENCIES.EUR) == "EUR"
+
+    def test_constants(self):
+        assert json_default(TENORS) == TENORS.to_json()
+
+    def test_other_objects(self):
+        with self.assertRaisesRegex(TypeError, "date is not JSON serializable"):
+            json_default(date(2020, 1, 1))
+
+
+class TestConstantsJSONEncoder(TestCase):
+    def test_dumps(self):
+        trades = make_trades(5)
+        assert json.dumps(trades, cls=ConstantsJSONEncoder) == json.dumps(trades)
+
+    def test_dumps_constant(self):
+        encoder = ConstantsJSONEncoder()
+        assert encoder.encode(TENORS.THREE_MONTH) == '"3M"'
+        # the fragment is reused
+        assert encoder.encode(TENORS.THREE_MONTH) == '"3M"'
+        assert list(encoder._fragments.values()) == ['"3M"']
+
+    def test_dumps_constants(self):
+        assert json.dumps(TENORS, cls=ConstantsJSONEncoder) == json.dumps(TENORS)
+
+    def test_json_values_are_cached(self):
+        encoder = ConstantsJSONEncoder()
+        encoder.encode(make_trades(10))
+        assert sorted(encoder._values.values()) == ["3M", "3M_EUR", "EUR", "USD"]
+
+    def test_stream(self):
+        trades = make_trades(25)
+        encoder = ConstantsJSONEncoder(batch_size=10)
+        chunks = list(encoder.iterencode(trades))
+        # brackets, three batches & their separators
+        assert len(chunks) == 7
+        assert "".join(chunks) == json.dumps(trades)
+
+    def test_stream_to_file(self):
+        trades = make_trades(25)
+        stream = io.StringIO()
+        json.dump(trades, stream, cls=ConstantsJSONEncoder, batch_size=10)
+        assert json.loads(stream.getvalue()) == json.loads(json.dumps(trades))
+
+    def test_stream_iterator(self):
+        trades = make_trades(25)
+        encoder = ConstantsJSONEncoder(batch_size=10)
+        assert "".join(encoder.iterencode(iter(trades))) == json.dumps(trades)
+        assert encoder.encode(iter(trades)) == json.dumps(trades)
+
+    def test_stream_empty(self):
+        encoder = ConstantsJSONEncoder()
+        assert "".join(encoder.iterencode([])) == "[]"
+        assert encoder.encode(iter([])) == "[]"
+
+    def test_separators(self):
+        trades = make_trades(3)
+        encoder = ConstantsJSONEncoder(batch_size=2, separators=(",", ":"))
+        assert "".join(encoder.iterencode(trades)) == json.dumps(
+            trades, separators=(",", ":")
+        )
+
+    def test_indent(self):
+        trades = make_trades(3)
+        encoder = ConstantsJSONEncoder(indent=2)
+        assert "".join(encoder.iterencode(iter(trades))) == json.dumps(trades, indent=2)
+
+    def test_circular_reference(self):
+        trades = make_trades(3)
+        trades.append(trades)
+        with self.assertRaisesRegex(ValueError, "Circular reference"):
+            "".join(ConstantsJSONEncoder().iterencode(trades))
+
+    def test_other_objects(self):
+        with self.assertRaises(TypeError):
+            json.dumps([date(2020, 1, 1)], cls=ConstantsJSONEncoder)
+
+
+class TestMsgpackCodec(TestCase):
+    def test_round_trip(self):
+        codec = MsgpackCodec()
+        quote = {
+            "currency": CURRENCIES.EUR,
+            "tenor": TENORS.THREE_MONTH,
+            "funding_basis": FUNDING_BASES.EUR_3M,
+            "spread": 1.5,
+        }
+        unpacked = codec.unpackb(codec.packb(quote))
+        assert unpacked == quote
+        assert unpacked["currency"] is CURRENCIES.EUR
+        assert unpacked["tenor"] is TENORS.THREE_MONTH
+        assert unpacked["funding_basis"] is FUNDING_BASES.EUR_3M
+
+    def test_ext_type(self):
+        codec = MsgpackCodec()
+        position = list(CURRENCIES).index(CURRENCIES.EUR)
+        assert codec.default(CURRENCIES.EUR) == msgpack.ExtType(1, bytes([position]))
+        # fixext 1: the header, the ext type code and the position
+        assert len(codec.packb(CURRENCIES.EUR)) == 3
+
+    def test_with_msgpack(self):
+        codec = MsgpackCodec()
+        data = msgpack.packb([TENORS.ONE_WEEK, None], default=codec.default)
+        assert msgpack.unpackb(data, ext_hook=codec.ext_hook) == [
+            TENORS.ONE_WEEK,
+            None,
+        ]
+
+    def test_constants_shared_by_constants(self):
+        codec = MsgpackCodec()
+        # the first ext type code is used when a constant is in several constants
+        assert FUNDING_BASES.EUR_3M in list(CD_FUNDING_BASES)
+        assert codec.default(FUNDING_BASES.EUR_3M).code == 3
+
+    def test_custom_ext_codes(self):
+        dummy = make_dummy_constants(300)
+        codec = MsgpackCodec({42: dummy})
+        assert codec.default(dummy.C0) == msgpack.ExtType(42, b"\x00")
+        assert codec.default(dummy.C299) == msgpack.ExtType(42, b"\x01\x2b")
+        assert codec.unpackb(codec.packb([dummy.C0, dummy.C299])) == [
+            dummy.C0,
+            dummy.C299,
+        ]
+
+    def test_invalid_ext_code(self):
+        with self.assertRaisesRegex(ValueError, "between 0 and 127, not 128"):
+            MsgpackCodec({128: "CURRENCIES"})
+
+    def test_unknown_constant(self):
+        codec = MsgpackCodec()
+        with self.assertRaisesRegex(TypeError, "isn't in any of the constants"):
+            codec.default(Constant(1, "One"))
+        with self.assertRaisesRegex(TypeError, "isn't in any of the constants"):
+            # equal to CURRENCIES.EUR but not the same constant
+            codec.default(Constant("EUR", "Euro"))
+        with self.assertRaises(TypeError):
+            codec.packb(date(2020, 1, 1))
+
+    def test_unknown_ext_code(self):
+        codec = MsgpackCodec({42: make_dummy_constants(1)})
+        assert codec.ext_hook(1, b"\x00") == msgpack.ExtType(1, b"\x00")
+
+    def test_unknown_position(self):
+        codec = MsgpackCodec({42: make_dummy_constants(1)})
+        with self.assertRaisesRegex(ValueError, "no constant at position 5"):
+            codec.ext_hook(42, b"\x05")
+
+    def test_changed_constants(self):
+        dummy = make_dummy_constants(2)
+        codec = MsgpackCodec({42: dummy})
+        assert codec.ext_hook(42, b"\x01") is dummy.C1
+        replaced = dummy.C1
+        assert codec.default(replaced).data == b"\x01"
+        dummy.make_mutable()
+        dummy.C1 = Constant(1, "One")
+        dummy.make_immutable()
+        assert codec.ext_hook(42, b"\x01") is dummy.C1
+        with self.assertRaises(TypeError):
+            codec.default(replaced)
+
+    def test_mutated_constants(self):
+        dummy = make_dummy_constants(1)
+        codec = MsgpackCodec({42: dummy})
+        assert codec.unpackb(codec.packb(dummy.C0)) is dummy.C0
+        with dummy.mutate() as draft:
+            draft.C1 = Constant(1, "One")
+        assert codec.packb(dummy.C1) == codec.packb(msgpack.ExtType(42, b"\x01"))
+        assert codec.unpackb(codec.packb(dummy.C1)) is dummy.C1
@@ -1,3 +1,4 @@
+import pickle
 from datetime import time
 from random import choice
 from unittest import TestCase
@@ -5,9 +6,11 @@ from unittest import TestCase
 from origin_common.better_test_mixins import LruCacheTestMixin
 from origin_common.constants import (
     ADJUSTMENTS,
+    BASIS_TYPE_GOVIE,
     BUSINESS_DAY_CONVENTIONS,
     CALENDARS,
     CD_FUNDING_BASES,
+    CURRENCIES,
     DAY_COUNTS,
     FUNDING_BASES,
     MTN_FUNDING_BASES,
@@ -1686,6 +1689,16 @@ class TestCDFundingBasesOrder(LruCacheTestMixin, TestCase):
 
 
 class TestFundingBasisComparisons(TestCase):
+    def test_sorting(self):
+        bases = [FUNDING_BASES.JPY_FIXED, FUNDING_BASES.EUR_3M.value]
+        assert sorted(bases) == [FUNDING_BASES.EUR_3M.value, FUNDING_BASES.JPY_FIXED]
+        assert FUNDING_BASES.sort(bases) == sorted(bases)
+        assert FUNDING_BASES.EUR_3M.ordinal < FUNDING_BASES.JPY_FIXED.ordinal
+
+    def test_cd_bases_have_the_ordinal_of_mtn_bases(self):
+        assert CD_FUNDING_BASES.USD_FIXED is not MTN_FUNDING_BASES.USD_FIXED
+        assert CD_FUNDING_BASES.USD_FIXED.ordinal == MTN_FUNDING_BASES.USD_FIXED.ordinal
+
     def test_less_than_funding_basis(self):
         assert FUNDING_BASES.EUR_3M < FUNDING_BASES.JPY_FIXED
         assert FUNDING_BASES.JPY_FIXED <= FUNDING_BASES.JPY_FIXED
@@ -1717,3 +1730,63 @@ class TestFundingBasisComparisons(TestCase):
         assert FUNDING_BASES.JPY_FIXED.value >= FUNDING_BASES.EUR_3M
         assert FUNDING_BASES.JPY_FIXED > FUNDING_BASES.EUR_3M.value
         assert FUNDING_BASES.JPY_FIXED >= FUNDING_BASES.JPY_FIXED.value
+
+
+class TestFundingBasesFilter(TestCase):
+    def test_filter(self):
+        expected = tuple(
+            basis
+            for basis in FUNDING_BASES
+            if basis.currency == CURRENCIES.EUR and basis.is_floating_basis
+        )
+        assert expected
+        assert (
+            FUNDING_BASES.filter(currency=CURRENCIES.EUR, is_floating_basis=True)
+            == expected
+        )
+
+    def test_filter_on_related_attributes(self):
+        expected = tuple(basis for basis in FUNDING_BASES if basis.currency.is_g10)
+        assert FUNDING_BASES.filter(currency__is_g10=True) == expected
+
+    def test_group_by(self):
+        groups = FUNDING_BASES.group_by("basis_type")
+        assert groups[BASIS_TYPE_GOVIE] == tuple(
+            basis for basis in FUNDING_BASES if basis.is_govie_basis
+        )
+
+
+class TestFundingBasisLayout(TestCase):
+    def test_funding_bases_do_not_have_a_dict(self):
+        for basis in list(MTN_FUNDING_BASES) + list(CD_FUNDING_BASES):
+            assert not hasattr(basis, "__dict__"), basis.value
+
+    def test_fixing_info_does_not_have_a_dict(self):
+        assert not hasattr(EURIBOR, "__dict__")
+
+
+class TestFundingBasesPickling(TestCase):
+    def test_pickled_as_the_same_constants(self):
+        for funding_bases in (FUNDING_BASES, MTN_FUNDING_BASES, CD_FUNDING_BASES):
+            bases = list(funding_bases)
+            assert pickle.loads(pickle.dumps(bases)) == bases
+            assert all(a is b for a, b in zip(pickle.loads(pickle.dumps(bases)), bases))
+
+    def test_replaced_constants_are_pickled_as_the_replacement(self):
+        assert CD_FUNDING_BASES.USD_FIXED is not FUNDING_BASES.USD_FIXED
+        data = pickle.dumps(CD_FUNDING_BASES.USD_FIXED)
+        assert pickle.loads(data) is CD_FUNDING_BASES.USD_FIXED
+
+
+class TestFundingBasesLookup(TestCase):
+    def test_lookup(self):
+        assert FUNDING_BASES.lookup("3m euribor") is FUNDING_BASES.EUR_3M
+        assert FUNDING_BASES.lookup("6mUSD LIBOR") is FUNDING_BASES.USD_6M
+        assert FUNDING_BASES.lookup("3m_eur") is FUNDING_BASES.EUR_3M
+
+    def test_lookup_by_legal_label(self):
+        assert FUNDING_BASES.lookup("3 Month EURIBOR") is FUNDING_BASES.EUR_3M
+
+    def test_screen_pages_shared_by_funding_bases_do_not_match(self):
+        assert FUNDING_BASES.EUR_6M.screen_page == FUNDING_BASES.EUR_3M.screen_page
+        assert FUNDING_BASES.lookup("EURIBOR01", None) is None
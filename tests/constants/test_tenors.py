@@ -1,16 +1,18 @@
+import copy
 import json
-from datetime import timedelta
+import pickle
+from datetime import date, timedelta
 from random import choice
 from unittest import TestCase
 
-from origin_common.constants import TENORS
+from origin_common.constants import PAYMENT_FREQUENCIES, TENORS
 from origin_common.constants.tenors import (
     ONE_MONTH_TIMEDELTA,
     ONE_YEAR_TIMEDELTA,
     THREE_MONTH_TIMEDELTA,
     Tenor,
 )
-from origin_common.utils import DAYS_IN_A_MONTH, DAYS_IN_A_WEEK, DAYS_IN_A_YEAR
+from origin_common.utils import DAYS_IN_A_MONTH, DAYS_IN_A_WEEK, DAYS_IN_A_YEAR, Period
 
 
 class TestTenorValues(TestCase):
@@ -1002,6 +1004,55 @@ class TestTenorIsCallableTenor(TestCase):
         assert TENORS.FIFTY_YEAR.is_callable_tenor is True
 
 
+class TestTenorPeriod(TestCase):
+    def test_pickle_and_copy_loose_tenor(self):
+        tenor = Tenor(timedelta(days=18 * DAYS_IN_A_MONTH), "1.5Y", "red")
+        for copied in (
+            pickle.loads(pickle.dumps(tenor)),
+            copy.copy(tenor),
+            copy.deepcopy(tenor),
+        ):
+            assert copied is not tenor
+            assert copied.value == tenor.value
+            assert copied.period == Period(18, "M")
+
+    def test_pickle_and_copy_period_of_tenor(self):
+        period = TENORS.TWO_WEEK.period
+        assert pickle.loads(pickle.dumps(period)) == period
+        assert copy.deepcopy(period) == period
+
+    def test_periods(self):
+        assert TENORS.OVERNIGHT.period == Period(1, "D")
+        assert TENORS.TWO_WEEK.period == Period(2, "W")
+        assert TENORS.ONE_AND_HALF_YEAR.period == Period(18, "M")
+        assert TENORS.FIFTY_YEAR.period == Period(50, "Y")
+
+    def test_period_is_the_value(self):
+        for tenor in TENORS:
+            assert tenor.period.to_timedelta() == tenor.value
+
+    def test_periods_are_exact(self):
+        assert TENORS.ONE_YEAR.period - TENORS.SIX_MONTH.period == (
+            TENORS.SIX_MONTH.period
+        )
+
+    def test_period_is_not_listed(self):
+        assert "period" not in str(TENORS.ONE_YEAR)
+
+    def test_period_follows_the_value(self):
+        tenor = Tenor(ONE_MONTH_TIMEDELTA, "1M", "red")
+        assert tenor.period == Period(1, "M")
+        assert tenor.is_callable_tenor is True
+        tenor.value = timedelta(days=45)
+        assert tenor.period == Period(45, "D")
+        assert tenor.is_callable_tenor is False
+
+    def test_no_period(self):
+        tenor = Tenor(timedelta(days=1.1 * DAYS_IN_A_YEAR), "1.1Y", "red")
+        assert tenor.period is None
+        assert tenor.is_callable_tenor is True
+
+
 class TestTenorJsonDumps(TestCase):
     def test_dump_uses_label_instead_of_value(self):
         assert json.dumps(TENORS) == json.dumps([t.label for t in TENORS])
@@ -1108,6 +1159,22 @@ class TestTenorArithmetic(TestCase):
         self.assertRaises(ZeroDivisionError, lambda: a // 0)
         self.assertRaises(ZeroDivisionError, lambda: a / 0.0)
 
+    def test_can_add_dates(self):
+        assert date(2020, 1, 1) + TENORS.ONE_WEEK == date(2020, 1, 8)
+        assert TENORS.ONE_WEEK + date(2020, 1, 1) == date(2020, 1, 8)
+        assert date(2020, 1, 8) - TENORS.ONE_WEEK == date(2020, 1, 1)
+
+    def test_cannot_operate_with_other_constants(self):
+        with self.assertRaises(TypeError):
+            TENORS.ONE_YEAR + PAYMENT_FREQUENCIES.ANNUALLY
+
+    def test_operator_methods_are_made_once(self):
+        assert Tenor.__add__.__qualname__ == "Tenor.__add__"
+        assert "__add__" in vars(Tenor)
+        tenor = Tenor(timedelta(days=14), "2W", "#000000")
+        assert type(tenor).__add__ is Tenor.__add__
+        assert tenor + TENORS.OVERNIGHT == timedelta(days=15)
+
 
 class TestTenorFunctions(TestCase):
     def test_can_call_total_seconds(self):
@@ -1,15 +1,30 @@
+import copy
+import pickle
 from datetime import timedelta
-from random import choice
+from random import Random, choice
 from unittest import TestCase
 
+import numpy
+
 from origin_common.constants import TENORS
 from origin_common.utils import (
     DAYS_IN_A_MONTH,
     DAYS_IN_A_WEEK,
     DAYS_IN_A_YEAR,
+    TENOR_CACHE_SIZE,
+    Period,
+    TenorRangeIndex,
+    clear_tenor_cache,
     expand_duration_unit,
+    format_tenors,
     join_list,
+    parse_tenor_ranges,
+    parse_tenors,
+    set_tenor_cache_size,
+    string_to_period,
     string_to_timedelta,
+    tenor_cache_info,
+    timedelta_to_period,
     timedelta_to_string,
 )
 
@@ -177,6 +192,8 @@ class TestStringToTimedelta(TestCase):
         self.assertRaises(
             ValueError, string_to_timedelta, "1Y -- 10Y"
         )  # double dash is invalid
+        self.assertRaises(ValueError, string_to_timedelta, "1Y-2Y-3Y")
+        self.assertRaises(ValueError, string_to_timedelta, "1-2Y-3Y")
 
     def test_ignores_asterisk(self):
         assert string_to_timedelta("1Y*") == timedelta(days=1 * DAYS_IN_A_YEAR)
@@ -197,11 +214,286 @@ class TestStringToTimedelta(TestCase):
         assert string_to_timedelta("nc10m") == timedelta(days=10 * DAYS_IN_A_MONTH)
         assert string_to_timedelta(" nc 10m") == timedelta(days=10 * DAYS_IN_A_MONTH)
 
+    def test_decimals(self):
+        assert string_to_timedelta("1.25Y") == timedelta(days=1.25 * DAYS_IN_A_YEAR)
+        assert string_to_timedelta("0.1M") == timedelta(days=0.1 * DAYS_IN_A_MONTH)
+        self.assertRaises(ValueError, string_to_timedelta, "1.Y")
+        self.assertRaises(ValueError, string_to_timedelta, ".5Y")
+        self.assertRaises(ValueError, string_to_timedelta, "1.2.3Y")
+
+    def test_returns_units(self):
+        assert string_to_timedelta(" nc 10 Years* ", return_units=True) == (
+            timedelta(days=10 * DAYS_IN_A_YEAR),
+            "Years",
+        )
+        assert string_to_timedelta("2wks", return_units=True)[1] == "wks"
+        assert string_to_timedelta("Overnight", return_units=True)[1] == "O/N"
+
     def test_returns_timedelta_unchanged(self):
         td = timedelta(days=4 * DAYS_IN_A_YEAR)
         assert string_to_timedelta(td) is td
 
 
+class TestStringToTimedeltaCache(TestCase):
+    def setUp(self):
+        clear_tenor_cache()
+        self.addCleanup(set_tenor_cache_size, TENOR_CACHE_SIZE)
+
+    def test_strings_are_cached(self):
+        assert string_to_timedelta("3M") is string_to_timedelta("3M")
+        assert string_to_timedelta("1-3Y") is string_to_timedelta("1-3Y")
+        info = tenor_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+    def test_case_and_whitespace_share_an_entry(self):
+        for tenor in ("3M", "3m", " 3M ", "3m\t", "o/n", "O/N", " O/n "):
+            string_to_timedelta(tenor)
+        assert tenor_cache_info().currsize == 2
+
+    def test_upper_casing_does_not_change_the_parsing(self):
+        assert string_to_timedelta("OVERNIGHT") == timedelta(days=1)
+        # the dotless i is upper cased to I, but isn't an i of the grammar
+        with self.assertRaises(ValueError):
+            string_to_timedelta("overn\u0131ght")
+        assert string_to_timedelta("3 month\u017f") == string_to_timedelta("3M")
+
+    def test_units_are_returned_as_given(self):
+        assert string_to_timedelta("3M", return_units=True)[1] == "M"
+        assert string_to_timedelta(" 3 months* ", return_units=True)[1] == "months"
+        assert string_to_timedelta("3", return_units=True)[1] is None
+        assert string_to_timedelta("o/n", return_units=True)[1] == "O/N"
+
+    def test_errors_show_the_string_as_given(self):
+        string_to_timedelta("1Y")
+        with self.assertRaisesRegex(ValueError, '"1 yonth"'):
+            string_to_timedelta("1 yonth")
+        with self.assertRaisesRegex(ValueError, '"1y - 10m"'):
+            string_to_timedelta("1y - 10m")
+        with self.assertRaisesRegex(ValueError, '"1.y"'):
+            string_to_timedelta(" 3m - 1.y ")
+
+    def test_cache_size(self):
+        set_tenor_cache_size(2)
+        for tenor in ("1M", "2M", "3M"):
+            string_to_timedelta(tenor)
+        info = tenor_cache_info()
+        assert (info.maxsize, info.currsize) == (2, 2)
+
+    def test_cache_can_be_disabled(self):
+        set_tenor_cache_size(0)
+        assert string_to_timedelta("3M") == timedelta(days=3 * DAYS_IN_A_MONTH)
+        assert tenor_cache_info().currsize == 0
+
+
+def to_timedelta64(*tenors):
+    return numpy.array(
+        [string_to_timedelta(t) if t else None for t in tenors], dtype="m8[us]"
+    )
+
+
+class TestParseTenors(TestCase):
+    def test_parse(self):
+        durations = parse_tenors(["3M", "1Y", "3m", "O/N"])
+        assert durations.dtype == numpy.dtype("m8[us]")
+        numpy.testing.assert_array_equal(
+            durations, to_timedelta64("3M", "1Y", "3M", "O/N")
+        )
+
+    def test_shape_is_kept(self):
+        durations = parse_tenors(numpy.array([["3M", "1Y"], ["2W", "3M"]]))
+        assert durations.shape == (2, 2)
+        numpy.testing.assert_array_equal(
+            durations[1],
+            to_timedelta64("2W", "3M"),
+        )
+
+    def test_distinct_values_are_parsed_once(self):
+        clear_tenor_cache()
+        parse_tenors(["3M", "1Y", "3M"] * 100)
+        assert tenor_cache_info().misses == 2
+
+    def test_missing_values(self):
+        durations = parse_tenors(["3M", None, float("nan")])
+        numpy.testing.assert_array_equal(numpy.isnat(durations), [False, True, True])
+
+    def test_timedeltas(self):
+        td = timedelta(days=10)
+        assert parse_tenors([td])[0] == numpy.timedelta64(td)
+
+    def test_tenors_periods_and_timedelta64(self):
+        durations = parse_tenors(
+            [TENORS.THREE_MONTH, Period(1, "Y"), numpy.timedelta64(2, "D")]
+        )
+        numpy.testing.assert_array_equal(durations[:2], to_timedelta64("3M", "1Y"))
+        assert durations[2] == numpy.timedelta64(timedelta(days=2))
+
+    def test_missing_timedelta64(self):
+        assert numpy.isnat(parse_tenors([numpy.timedelta64("NaT")])[0])
+
+    def test_empty(self):
+        assert parse_tenors([]).shape == (0,)
+
+    def test_raise(self):
+        with self.assertRaisesRegex(ValueError, "'3X', '1-3Y' & 5"):
+            parse_tenors(["3M", "3X", "1-3Y", 5, "3X"])
+
+    def test_mask(self):
+        durations = parse_tenors(["3M", "3X", None, "1-3Y"], on_error="mask")
+        assert isinstance(durations, numpy.ma.MaskedArray)
+        numpy.testing.assert_array_equal(durations.mask, [False, True, False, True])
+        assert durations[0] == numpy.timedelta64(string_to_timedelta("3M"))
+
+    def test_unhashable_values(self):
+        ragged = numpy.empty(3, dtype=object)
+        ragged[:] = ["3M", ["1Y"], ["1Y", "2Y"]]
+        with self.assertRaisesRegex(ValueError, r"Invalid tenors \['1Y'\] & "):
+            parse_tenors(ragged)
+        durations = parse_tenors(ragged, on_error="mask")
+        numpy.testing.assert_array_equal(durations.mask, [False, True, True])
+
+    def test_invalid_on_error(self):
+        with self.assertRaisesRegex(ValueError, "must be one of raise & mask"):
+            parse_tenors(["3M"], on_error="skip")
+
+
+class TestParseTenorRanges(TestCase):
+    def test_parse(self):
+        starts, ends = parse_tenor_ranges(["1-3Y", "3-5Y", "1-3Y", None])
+        numpy.testing.assert_array_equal(starts, to_timedelta64("1Y", "3Y", "1Y", None))
+        numpy.testing.assert_array_equal(ends, to_timedelta64("3Y", "5Y", "3Y", None))
+
+    def test_raise(self):
+        with self.assertRaisesRegex(ValueError, "'3M' & '5-3Y'"):
+            parse_tenor_ranges(["1-3Y", "3M", "5-3Y"])
+
+    def test_mask(self):
+        starts, ends = parse_tenor_ranges(["1-3Y", "3M"], on_error="mask")
+        numpy.testing.assert_array_equal(starts.mask, [False, True])
+        numpy.testing.assert_array_equal(ends.mask, [False, True])
+        assert ends[0] == numpy.timedelta64(string_to_timedelta("3Y"))
+
+
+class TestPeriod(TestCase):
+    def test_years_are_months(self):
+        period = Period(2, "Y")
+        assert (period.count, period.unit) == (24, "M")
+        assert period == Period(24, "M")
+        assert hash(period) == hash(Period(24, "M"))
+
+    def test_invalid_unit(self):
+        with self.assertRaises(ValueError):
+            Period(1, "Q")
+
+    def test_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            Period(1, "M").count = 2
+
+    def test_pickle_and_copy(self):
+        period = Period(2, "W")
+        for copied in (
+            pickle.loads(pickle.dumps(period)),
+            copy.copy(period),
+            copy.deepcopy(period),
+        ):
+            assert (copied.count, copied.unit, copied.length) == (2, "W", 8766)
+
+    def test_count_must_be_int(self):
+        with self.assertRaises(TypeError):
+            Period(1.5, "Y")
+
+    def test_to_timedelta(self):
+        assert Period(1, "D").to_timedelta() == timedelta(days=1)
+        assert Period(2, "W").to_timedelta() == timedelta(days=2 * DAYS_IN_A_WEEK)
+        assert Period(3, "M").to_timedelta() == timedelta(days=3 * DAYS_IN_A_MONTH)
+        assert Period(10, "Y").to_timedelta() == timedelta(days=10 * DAYS_IN_A_YEAR)
+
+    def test_compares_exactly_across_units(self):
+        assert Period(13, "W") == Period(3, "M")
+        assert Period(1, "W") > Period(7, "D")
+        assert Period(4, "W") < Period(1, "M") < Period(5, "W")
+        assert sorted([Period(1, "Y"), Period(1, "D"), Period(2, "W")]) == [
+            Period(1, "D"),
+            Period(2, "W"),
+            Period(1, "Y"),
+        ]
+
+    def test_is_not_equal_to_timedelta(self):
+        assert Period(1, "D") != timedelta(days=1)
+        with self.assertRaises(TypeError):
+            Period(1, "D") < timedelta(days=2)
+
+    def test_arithmetic(self):
+        assert Period(1, "Y") - Period(6, "M") == Period(6, "M")
+        assert Period(1, "M") + Period(2, "M") == Period(3, "M")
+        assert 4 * Period(3, "M") == Period(1, "Y")
+        assert Period(18, "M") // Period(1, "Y") == 1
+        assert Period(18, "M") % Period(1, "Y") == Period(6, "M")
+
+    def test_arithmetic_across_units(self):
+        result = Period(3, "M") - Period(1, "W")
+        assert (result.count, result.unit) == (12, "W")
+        with self.assertRaisesRegex(TypeError, "isn't a whole number of months"):
+            Period(1, "W") + Period(1, "D")
+        with self.assertRaisesRegex(TypeError, "isn't a whole number of months"):
+            Period(1, "M") - Period(1, "D")
+        with self.assertRaisesRegex(TypeError, "isn't a whole number of months"):
+            Period(1, "M") % Period(1, "D")
+
+    def test_str(self):
+        assert str(Period(18, "M")) == "1.5Y"
+        assert str(Period(1, "D")) == "O/N"
+        assert repr(Period(2, "W")) == "Period(2, 'W')"
+
+
+class TestTimedeltaToPeriod(TestCase):
+    def test_months(self):
+        period = timedelta_to_period(timedelta(days=18 * DAYS_IN_A_MONTH))
+        assert (period.count, period.unit) == (18, "M")
+
+    def test_weeks(self):
+        period = timedelta_to_period(timedelta(days=2 * DAYS_IN_A_WEEK))
+        assert (period.count, period.unit) == (2, "W")
+
+    def test_days(self):
+        period = timedelta_to_period(timedelta(days=7))
+        assert (period.count, period.unit) == (7, "D")
+
+    def test_not_a_period(self):
+        assert timedelta_to_period(timedelta(hours=1)) is None
+        assert timedelta_to_period(string_to_timedelta("1.1Y")) is None
+
+    def test_tenors(self):
+        for tenor in TENORS:
+            assert timedelta_to_period(tenor.value).to_timedelta() == tenor.value
+
+
+class TestStringToPeriod(TestCase):
+    def test_tenors(self):
+        assert string_to_period("3M") == Period(3, "M")
+        assert string_to_period(" nc 1.5 years*") == Period(18, "M")
+        assert string_to_period("O/N") == Period(1, "D")
+
+    def test_weeks_stay_weeks(self):
+        period = string_to_period("13W")
+        assert (period.count, period.unit) == (13, "W")
+
+    def test_same_timedelta_as_string_to_timedelta(self):
+        for tenor in ("2W", "6M", "1.25Y", "30Y"):
+            assert string_to_period(tenor).to_timedelta() == string_to_timedelta(tenor)
+
+    def test_not_a_period(self):
+        with self.assertRaises(ValueError):
+            string_to_period("1.1Y")
+
+    def test_range(self):
+        with self.assertRaises(ValueError):
+            string_to_period("1-3Y")
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            string_to_period("3X")
+
+
 class TestTimedeltaToString(TestCase):
     def test_non_initial_units_is_correct(self):
         tenors_to_test = {
@@ -268,3 +560,168 @@ class TestTimedeltaToString(TestCase):
     def test_works_with_tenors(self):
         tenor = choice(list(TENORS))
         assert timedelta_to_string(tenor) == tenor.label
+
+    def test_works_with_periods(self):
+        assert timedelta_to_string(Period(18, "M")) == "1.5Y"
+        assert timedelta_to_string(Period(13, "M"), only_initial=False) == "13 Months"
+        assert timedelta_to_string(Period(2, "W")) == "2W"
+        assert timedelta_to_string(Period(0, "M")) == "0"
+
+
+class TestFormatTenors(TestCase):
+    def setUp(self):
+        self.durations = [
+            timedelta(days=1.5 * DAYS_IN_A_YEAR),
+            timedelta(days=18 * DAYS_IN_A_MONTH),
+            timedelta(days=10),
+            timedelta(days=1),
+            timedelta(0),
+            string_to_timedelta("10.234Y"),
+        ]
+
+    def assert_same_as_timedelta_to_string(self, **flags):
+        expected = [timedelta_to_string(d, **flags) for d in self.durations]
+        assert format_tenors(self.durations, **flags).tolist() == expected
+        timedelta64s = numpy.array(self.durations, dtype="m8[us]")
+        assert format_tenors(timedelta64s, **flags).tolist() == expected
+
+    def test_same_as_timedelta_to_string(self):
+        self.assert_same_as_timedelta_to_string()
+        self.assert_same_as_timedelta_to_string(only_initial=False)
+        self.assert_same_as_timedelta_to_string(round_ndigits=2)
+        self.assert_same_as_timedelta_to_string(only_quarter_years=False)
+        self.assert_same_as_timedelta_to_string(for_quantlib=True)
+
+    def test_values(self):
+        assert format_tenors(self.durations, round_ndigits=3).tolist() == [
+            "1.5Y",
+            "1.5Y",
+            "1W",
+            "O/N",
+            "0",
+            "122.808M",
+        ]
+
+    def test_shape_is_kept(self):
+        durations = numpy.array([[1, 7], [30, 365]], dtype="m8[D]")
+        assert format_tenors(durations, round_ndigits=0).tolist() == [
+            ["O/N", "0W"],
+            ["4W", "12M"],
+        ]
+
+    def test_missing_values_and_strings(self):
+        durations = [None, numpy.timedelta64("NaT"), "1 day", timedelta(days=14)]
+        assert format_tenors(durations).tolist() == [None, None, "1 day", "1W"]
+        durations = numpy.array([1, "NaT"], dtype="m8[D]")
+        assert format_tenors(durations).tolist() == ["O/N", None]
+
+    def test_large_durations(self):
+        durations = [timedelta(days=999999999), timedelta(days=-(10**6))]
+        assert format_tenors(durations).tolist() == [
+            timedelta_to_string(d) for d in durations
+        ]
+
+    def test_works_with_tenors(self):
+        assert format_tenors(list(TENORS)).tolist() == [t.label for t in TENORS]
+
+    def test_empty(self):
+        assert format_tenors([]).shape == (0,)
+
+    def test_quantlib_requires_only_initials(self):
+        with self.assertRaisesRegex(AssertionError, "QuantLib requires"):
+            format_tenors(self.durations, only_initial=False, for_quantlib=True)
+
+
+class TestTenorRangeIndex(TestCase):
+    def setUp(self):
+        self.ranges = [
+            "1-3Y",
+            "6M-2Y",
+            "nc5-10Y",
+            (timedelta(days=10), timedelta(days=400)),
+        ]
+        self.index = TenorRangeIndex(self.ranges)
+
+    def assert_positions(self, positions, expected):
+        assert positions.tolist() == expected
+
+    def test_ranges(self):
+        assert self.index.ranges == self.ranges
+        assert len(self.index) == 4
+        assert self.index.starts[2] == numpy.timedelta64(string_to_timedelta("5Y"))
+        assert self.index.ends[0] == numpy.timedelta64(string_to_timedelta("3Y"))
+
+    def test_containing_tenor(self):
+        self.assert_positions(self.index.containing("1Y"), [0, 1, 3])
+        self.assert_positions(self.index.containing(TENORS.SIX_MONTH), [1, 3])
+        self.assert_positions(self.index.containing(Period(30, "Y")), [])
+        self.assert_positions(self.index.containing(timedelta(days=10)), [3])
+
+    def test_ranges_include_their_ends(self):
+        self.assert_positions(self.index.containing("3Y"), [0])
+        self.assert_positions(self.index.containing("10Y"), [2])
+
+    def test_containing_range(self):
+        self.assert_positions(self.index.containing("1-2Y"), [0, 1])
+        self.assert_positions(self.index.containing("2-4Y"), [])
+
+    def test_overlapping(self):
+        self.assert_positions(self.index.overlapping("2-5Y"), [0, 1, 2])
+        self.assert_positions(self.index.overlapping("1Y"), [0, 1, 3])
+        self.assert_positions(self.index.overlapping("4Y"), [])
+
+    def test_containing_many(self):
+        matches = self.index.containing_many(["1Y", "3Y", "1Y", "40Y"])
+        assert [positions.tolist() for positions in matches] == [
+            [0, 1, 3],
+            [0],
+            [0, 1, 3],
+            [],
+        ]
+        assert matches[0] is matches[2]
+
+    def test_overlapping_many(self):
+        matches = self.index.overlapping_many(["2-5Y", "4Y"])
+        assert [positions.tolist() for positions in matches] == [[0, 1, 2], []]
+
+    def test_many_timedelta64(self):
+        tenors = numpy.array([1, 365, "NaT"], dtype="m8[D]")
+        matches = self.index.containing_many(tenors)
+        assert [positions.tolist() for positions in matches] == [[], [1, 3], []]
+
+    def test_matches_are_read_only(self):
+        with self.assertRaises(ValueError):
+            self.index.containing("1Y")[0] = 2
+
+    def test_same_as_linear_scan(self):
+        rng = Random(0)
+        labels = [tenor.label for tenor in TENORS]
+        ranges = []
+        for _ in range(200):
+            first, last = sorted(rng.sample(range(len(labels)), 2))
+            ranges.append(f"{labels[first]}-{labels[last]}")
+        index = TenorRangeIndex(ranges)
+        parsed = [string_to_timedelta(value) for value in ranges]
+        queries = [rng.choice(labels) for _ in range(100)]
+        queries += [timedelta(days=rng.uniform(0, 20000)) for _ in range(100)]
+        for query, found in zip(queries, index.containing_many(queries)):
+            query = string_to_timedelta(query)
+            expected = [
+                position
+                for position, (start, end) in enumerate(parsed)
+                if start <= query <= end
+            ]
+            assert found.tolist() == expected
+
+    def test_empty(self):
+        index = TenorRangeIndex([])
+        self.assert_positions(index.containing("1Y"), [])
+        assert [positions.tolist() for positions in index.overlapping_many(["1Y"])] == [
+            []
+        ]
+
+    def test_invalid_ranges(self):
+        with self.assertRaisesRegex(
+            ValueError, r"Invalid tenor ranges '1Y', '3-1Y', None & 'x-y'\."
+        ):
+            TenorRangeIndex(["1-3Y", "1Y", "3-1Y", None, "x-y"])